@@ -2,21 +2,83 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+import requests
+
+from niconico.objects.nvapi import parse_nvapi
+from niconico.utils import TTLCache
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from niconico.decorators import CacheKey
     from niconico.niconico import NicoNico
+    from niconico.objects.nvapi import NvAPIResponse
+
+T = TypeVar("T")
 
 
 class BaseClient:
     """A class that represents a base client."""
 
     niconico: NicoNico
+    cache: TTLCache[CacheKey]
+    etag_cache: TTLCache[tuple[str, tuple[tuple[str, str | int], ...]]]
 
     def __init__(self, niconico: NicoNico) -> None:
         """Initialize the base client."""
         self.niconico = niconico
+        self.cache = TTLCache()
+        self.etag_cache = TTLCache(maxsize=64, ttl=600)
+
+    def clear_cache(self) -> None:
+        """Drop every cached response of the client."""
+        self.cache.clear()
+        self.etag_cache.clear()
 
     def log(self, type_: str, message: str) -> None:
         """Log a message."""
         return getattr(self.niconico.logger, type_)(message)
+
+    def _get_data(
+        self,
+        url: str,
+        response_cls: type[NvAPIResponse[T]],
+        *,
+        params: Mapping[str, str | int] | None = None,
+        conditional: bool = False,
+    ) -> T | None:
+        """Send a GET request to an NvAPI endpoint and return the data of its response.
+
+        With ``conditional``, the body of a response carrying an ETag is remembered, the next identical request
+        sends If-None-Match, and on 304 Not Modified the remembered body is parsed again instead of downloaded.
+        Each call therefore still returns a new object.
+
+        Args:
+            url (str): The URL to send the request to.
+            response_cls (type[NvAPIResponse[T]]): The response model to parse the body into.
+            params (Mapping[str, str | int] | None): The query parameters to send with the request.
+            conditional (bool): Whether to make the request conditional on the ETag of an earlier response.
+
+        Returns:
+            T | None: The data of the response if the request succeeded, None otherwise.
+        """
+        if not conditional:
+            res = self.niconico.get(url, params=params)
+            if res.status_code != requests.codes.ok:
+                return None
+            return parse_nvapi(response_cls, res.content).data
+        key = (url, tuple(sorted(params.items())) if params else ())
+        cached = self.etag_cache.get(key)
+        headers = None if cached is None else {"If-None-Match": cached[0]}
+        res = self.niconico.get(url, params=params, headers=headers)
+        if res.status_code == requests.codes.not_modified and cached is not None:
+            return parse_nvapi(response_cls, cached[1]).data
+        if res.status_code != requests.codes.ok:
+            return None
+        data = parse_nvapi(response_cls, res.content).data
+        etag = res.headers.get("ETag")
+        if etag is not None and data is not None:
+            self.etag_cache.set(key, (etag, res.content))
+        return data
@@ -8,6 +8,7 @@ import requests
 
 from niconico.base.client import BaseClient
 from niconico.objects.channel.search import ChannelSearchItem, ChSearchAPIResponse
+from niconico.utils import build_query
 
 
 class ChannelSearchClient(BaseClient):
@@ -36,18 +37,18 @@ class ChannelSearchClient(BaseClient):
         Returns:
             list[ChannelSearchItem]: Channel search item list.
         """
-        query_dict = {
-            "query": query,
-            "searchType": search_type,
-            "limit": str(limit),
-            "offset": str(offset),
-            "order": order,
-            "responseGroup": "detail",
-        }
-        if sort is not None:
-            query_dict["sort"] = sort
-        query_str = "&".join(f"{key}={value}" for key, value in query_dict.items())
-        res = self.niconico.get(f"https://public-api.ch.nicovideo.jp/v1/open/search/channels?{query_str}")
+        query_dict = build_query(
+            {
+                "query": query,
+                "searchType": search_type,
+                "limit": limit,
+                "offset": offset,
+                "order": order,
+                "responseGroup": "detail",
+                "sort": sort,
+            },
+        )
+        res = self.niconico.get("https://public-api.ch.nicovideo.jp/v1/open/search/channels", params=query_dict)
         if res.status_code == requests.codes.ok:
             res_cls = ChSearchAPIResponse(**res.json())
             if res_cls.data is not None:
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from copy import copy
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Tuple, TypeVar
 
 from niconico.exceptions import LoginRequiredError, PremiumRequiredError
 
@@ -12,6 +13,9 @@ if TYPE_CHECKING:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# The key of a result cached by cached(): (method name, positional arguments, sorted keyword arguments).
+CacheKey = Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]
+
 
 def login_required(*, premium: bool = False) -> Callable[[F], F]:
     """A decorator that requires a login to be performed."""
@@ -28,3 +32,29 @@ def login_required(*, premium: bool = False) -> Callable[[F], F]:
         return wrapper  # type: ignore  # noqa: PGH003
 
     return decorator
+
+
+def cached() -> Callable[[F], F]:
+    """A decorator that caches the result of a client method in the client's TTL cache.
+
+    Results are keyed on the method name and its arguments. Falsy results (None and empty lists) are
+    never cached, since the methods also return them when a request fails, so those calls always hit the network.
+    Every caller gets its own shallow copy of a cached result, so mutating a returned list does not
+    affect the cache or other callers.
+    """
+
+    def decorator(func: F) -> F:
+        @wraps(func)
+        def wrapper(self: BaseClient, *args: Any, **kwargs: Any) -> F:  # noqa: ANN401
+            key: CacheKey = (func.__name__, args, tuple(sorted(kwargs.items())))
+            result = self.cache.get(key)
+            if result is None:
+                result = func(self, *args, **kwargs)
+                if result:
+                    self.cache.set(key, copy(result))
+                return result
+            return copy(result)
+
+        return wrapper  # type: ignore  # noqa: PGH003
+
+    return decorator
@@ -3,23 +3,37 @@
 from __future__ import annotations
 
 from logging import Logger, getLogger
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from niconico.channel import ChannelClient
 from niconico.exceptions import LoginFailureError
 from niconico.user import UserClient
 from niconico.video import VideoClient
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 logger = getLogger("niconico.py")
 
+# Seconds to wait for the server to accept a connection and to send each chunk of a response.
+DEFAULT_TIMEOUT = 10.0
+
+# Idempotent requests are retried on transient gateway errors (POST is excluded by Retry's defaults);
+# the last response is still returned so callers keep handling the status code themselves.
+RETRY = Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False)
+
 
 class NicoNico:
     """A class to interact with the NicoNico API."""
 
     logger: Logger
     session: requests.Session
+    timeout: float
     logined: bool
     premium: bool
 
@@ -31,33 +45,56 @@ class NicoNico:
         """Initialize the class."""
         self.logger = logger
         self.session = requests.Session()
+        # Keep enough pooled keep-alive connections per host for concurrent paging.
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50, max_retries=RETRY)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.timeout = DEFAULT_TIMEOUT
         self.logined = False
         self.video = VideoClient(self)
         self.user = UserClient(self)
         self.channel = ChannelClient(self)
 
-    def get(self, url: str) -> requests.Response:
+    def get(
+        self,
+        url: str,
+        *,
+        params: Mapping[str, str | int] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
         """Send a GET request to a URL.
 
         Args:
             url (str): The URL to send the request to.
+            params (Mapping[str, str | int]): The query parameters to send with the request.
+            headers (dict[str, str]): The headers to send with the request.
+            timeout (float | None): The timeout in seconds. If None, the client's default timeout is used.
 
         Returns:
             requests.Response: The response object.
         """
         parsed_url = urlparse(url)
-        headers = {
+        req_headers = {
             "User-Agent": "niconico.py",
             "X-Frontend-Id": "6",
             "X-Frontend-Version": "0",
             "Host": parsed_url.netloc,
         }
-        return self.session.get(url, headers=headers)
+        if headers is not None:
+            req_headers.update(headers)
+        return self.session.get(
+            url,
+            params=params,
+            headers=req_headers,
+            timeout=self.timeout if timeout is None else timeout,
+        )
 
     def post(
         self,
         url: str,
         *,
+        params: Mapping[str, str | int] | None = None,
         data: any | None = None,  # type: ignore[valid-type]
         json: object | None = None,
         headers: dict[str, str] | None = None,
@@ -66,6 +103,7 @@ class NicoNico:
 
         Args:
             url (str): The URL to send the request to.
+            params (Mapping[str, str | int]): The query parameters to send with the request.
             data (any): The data to send with the request.
             json (object): The data to send with the request.
             headers (dict[str, str]): The headers to send with the request.
@@ -87,19 +125,21 @@ class NicoNico:
         if headers is not None:
             req_headers.update(headers)
         if json is None:
-            return self.session.post(url, headers=req_headers, data=data)
-        return self.session.post(url, headers=req_headers, json=json)
+            return self.session.post(url, params=params, headers=req_headers, data=data, timeout=self.timeout)
+        return self.session.post(url, params=params, headers=req_headers, json=json, timeout=self.timeout)
 
     def delete(
         self,
         url: str,
         *,
+        params: Mapping[str, str | int] | None = None,
         headers: dict[str, str] | None = None,
     ) -> requests.Response:
         """Send a DELETE request to a URL.
 
         Args:
             url (str): The URL to send the request to.
+            params (Mapping[str, str | int]): The query parameters to send with the request.
             headers (dict[str, str]): The headers to send with the request.
 
         Returns:
@@ -118,7 +158,7 @@ class NicoNico:
         }
         if headers is not None:
             req_headers.update(headers)
-        return self.session.delete(url, headers=req_headers)
+        return self.session.delete(url, params=params, headers=req_headers, timeout=self.timeout)
 
     def login_with_mail(self, mail: str, password: str, mfa: str | None = None) -> None:
         """Login to NicoNico with a mail and password.
@@ -129,6 +169,8 @@ class NicoNico:
             mfa (str | None): The MFA code to login with. Defaults to None.
         """
         self.logined = False
+        self.user.clear_cache()
+        self.video.search.clear_cache()
 
         res = self.session.post(
             "https://account.nicovideo.jp/login/redirector?site=niconico&next_url=%2F",
@@ -137,6 +179,7 @@ class NicoNico:
                 "password": password,
                 "auth_id": "1158188129",
             },
+            timeout=self.timeout,
         )
 
         if "/login" in res.url:
@@ -151,6 +194,7 @@ class NicoNico:
                     "otp": mfa,
                     "device_name": "niconico.py",
                 },
+                timeout=self.timeout,
             )
 
         if res.url != "https://www.nicovideo.jp/":
@@ -172,10 +216,12 @@ class NicoNico:
             session (str): The session to login with.
         """
         self.logined = False
+        self.user.clear_cache()
+        self.video.search.clear_cache()
 
         self.session.cookies.set("user_session", session)
 
-        res = self.session.get("https://www.nicovideo.jp/")
+        res = self.session.get("https://www.nicovideo.jp/", timeout=self.timeout)
 
         if res.url != "https://www.nicovideo.jp/":
             self.session.cookies.clear("", "/", "user_session")
@@ -206,10 +252,12 @@ class NicoNico:
         Updates authentication state to reflect logged out status.
         """
         if self.logined:
-            self.session.get("https://account.nicovideo.jp/logout")
+            self.session.get("https://account.nicovideo.jp/logout", timeout=self.timeout)
             self.session.cookies.clear("", "/", "user_session")
             self.logined = False
             self.premium = False
+            self.user.clear_cache()
+            self.video.search.clear_cache()
             self.logger.debug("Logged out from NicoNico")
         else:
             self.logger.warning("Not logged in, cannot logout")
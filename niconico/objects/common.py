@@ -4,12 +4,22 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+# Shared config for response models: validators are built on first use rather than at import time,
+# and camelCase aliases are generated from the field names.
+RESPONSE_MODEL_CONFIG = ConfigDict(defer_build=True, alias_generator=to_camel, populate_by_name=True)
+
+# Shared config for models that are instantiated once per item of a list response.
+ITEM_MODEL_CONFIG = ConfigDict(**RESPONSE_MODEL_CONFIG, extra="ignore", frozen=True)
 
 
 class UserIcon(BaseModel):
     """A class that represents the icons of a user."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     small: str
     large: str
 
@@ -17,6 +27,8 @@ class UserIcon(BaseModel):
 class EssentialUser(BaseModel):
     """A class that represents an essential user object."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     type_: Literal["essential"] = Field(..., alias="type")
     is_premium: bool = Field(..., alias="isPremium")
     description: str
@@ -30,6 +42,8 @@ class EssentialUser(BaseModel):
 class EssentialChannel(BaseModel):
     """A class that represents a essential channel object."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id_: str = Field(..., alias="id")
     name: str
     description: str
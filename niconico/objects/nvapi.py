@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+from datetime import datetime
+from typing import Annotated, Any, Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
+try:
+    from orjson import loads as _orjson_loads
+
+    def _loads(raw: bytes) -> Any:  # noqa: ANN401
+        return _orjson_loads(raw)
+
+except ImportError:
+    from json import loads as _json_loads
+
+    def _loads(raw: bytes) -> Any:  # noqa: ANN401
+        return _json_loads(raw)
+
+
+from niconico.objects.common import ITEM_MODEL_CONFIG, RESPONSE_MODEL_CONFIG
 from niconico.objects.user import (
     NicoUser,
     OwnNicoUser,
@@ -25,26 +40,77 @@ from niconico.objects.video.ranking import Genre
 from niconico.objects.video.search import EssentialMylist, EssentialSeries, FacetItem, VideoSearchAdditionals
 
 T = TypeVar("T")
+ModelT = TypeVar("ModelT", bound=BaseModel)
 
 
 class NvAPIMeta(BaseModel):
     """A class that represents the metadata of a response from the NvAPI."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: int
-    error_code: str | None = Field(None, alias="errorCode")
+    error_code: str | None = None
 
 
 class NvAPIResponse(BaseModel, Generic[T]):
     """A class that represents a response from the NvAPI."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     meta: NvAPIMeta
     data: T | None
 
 
+def parse_nvapi(cls: type[ModelT], raw: bytes) -> ModelT:
+    """Parse a raw response body from the NvAPI into a model.
+
+    The body is parsed and validated in a single pass by pydantic-core, without building an intermediate dict.
+
+    Args:
+        cls (type[ModelT]): The model class to parse into, e.g. ``NvAPIResponse[VideosData]``.
+        raw (bytes): The raw response body.
+
+    Returns:
+        ModelT: The parsed model.
+    """
+    return cls.model_validate_json(raw)
+
+
+def extract_tag_names(raw: bytes) -> list[str]:
+    """Extract only the tag names from a raw tags response body without building any model.
+
+    Args:
+        raw (bytes): The raw body of a ``/v2/videos/<video_id>/tags`` response.
+
+    Returns:
+        list[str]: The names of the tags, empty if the response has no data.
+    """
+    data = _loads(raw).get("data") or {}
+    return [tag["name"] for tag in data.get("tags", ())]
+
+
+def extract_user_video_fields(raw: bytes, fields: tuple[str, ...]) -> list[dict[str, Any]]:
+    """Extract only the given fields of each video from a raw user videos response body without building any model.
+
+    Args:
+        raw (bytes): The raw body of a ``/v3/users/<user_id>/videos`` or ``/v2/users/me/videos`` response.
+        fields (tuple[str, ...]): The camelCase keys to pick from the essential video object of each item,
+            e.g. ``("id", "title")``. Missing keys map to None.
+
+    Returns:
+        list[dict[str, Any]]: The picked fields of each video, empty if the response has no data.
+    """
+    data = _loads(raw).get("data") or {}
+    return [{field: item["essential"].get(field) for field in fields} for item in data.get("items", ())]
+
+
 class VideoItem(BaseModel):
     """A class that represents an item of a videos response from the NvAPI."""
 
-    watch_id: str = Field(..., alias="watchId")
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
+    watch_id: str
     video: EssentialVideo
 
 
@@ -54,6 +120,8 @@ class VideosData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/videos?watchIds=<video_id>
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[VideoItem]
 
 
@@ -63,9 +131,11 @@ class TagsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/videos/<video_id>/tags
     """
 
-    is_lockable: bool = Field(..., alias="isLockable")
-    is_editable: bool = Field(..., alias="isEditable")
-    uneditable_reason: str | None = Field(None, alias="uneditableReason")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    is_lockable: bool
+    is_editable: bool
+    uneditable_reason: str | None = None
     tags: list[Tag]
 
 
@@ -75,6 +145,8 @@ class MylistData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/mylists/<mylist_id>
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     mylist: Mylist
 
 
@@ -84,8 +156,10 @@ class SeriesData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/series/<series_id>
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     detail: SeriesDetail
-    total_count: int = Field(..., alias="totalCount")
+    total_count: int
     items: list[SeriesItem]
 
 
@@ -95,6 +169,8 @@ class GenresData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/genres
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     genres: list[Genre]
 
 
@@ -104,7 +180,9 @@ class PopularTagsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/genres/<genre_key>/popular-tags
     """
 
-    start_at: str = Field(..., alias="startAt")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    start_at: str
     tags: list[str]
 
 
@@ -114,8 +192,10 @@ class RankingData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/ranking/genre/<genre_key>
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[EssentialVideo]
-    has_next: bool = Field(..., alias="hasNext")
+    has_next: bool
 
 
 class VideoSearchData(BaseModel):
@@ -124,12 +204,14 @@ class VideoSearchData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/search/video
     """
 
-    search_id: str = Field(..., alias="searchId")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    search_id: str
     keyword: str | None
     tag: str | None
     genres: list[Genre]
-    total_count: int = Field(..., alias="totalCount")
-    has_next: bool = Field(..., alias="hasNext")
+    total_count: int
+    has_next: bool
     items: list[EssentialVideo]
     additionals: VideoSearchAdditionals
 
@@ -140,6 +222,8 @@ class FacetData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/search/facet
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[FacetItem]
 
 
@@ -149,10 +233,12 @@ class ListSearchData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/search/list
     """
 
-    search_id: str = Field(..., alias="searchId")
-    total_count: int = Field(..., alias="totalCount")
-    has_next: bool = Field(..., alias="hasNext")
-    items: list[EssentialSeries | EssentialMylist]
+    model_config = RESPONSE_MODEL_CONFIG
+
+    search_id: str
+    total_count: int
+    has_next: bool
+    items: list[Annotated[EssentialSeries | EssentialMylist, Field(discriminator="type_")]]
 
 
 class AccessRightsData(BaseModel):
@@ -161,9 +247,11 @@ class AccessRightsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/watch/<video_id>/access-rights/<type>
     """
 
-    content_url: str | None = Field(None, alias="contentUrl")
-    create_time: str | None = Field(None, alias="createTime")
-    expire_time: str | None = Field(None, alias="expireTime")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    content_url: str | None = None
+    create_time: datetime | None = None
+    expire_time: datetime | None = None
 
 
 class HistoryData(BaseModel):
@@ -172,8 +260,10 @@ class HistoryData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/watch/history
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[HistoryItem]
-    total_count: int = Field(..., alias="totalCount")
+    total_count: int
 
 
 class UserData(BaseModel):
@@ -182,6 +272,8 @@ class UserData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/<user_id>
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     user: NicoUser
     relationships: UserRelationships
 
@@ -192,6 +284,8 @@ class OwnUserData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     user: OwnNicoUser
 
 
@@ -201,6 +295,8 @@ class RelationshipUsersData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/<user_id>/<type>/users
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[RelationshipUser]
     summary: RelationshipUsersSummary
 
@@ -211,8 +307,10 @@ class UserVideosData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v3/users/<user_id>/videos
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[UserVideoItem]
-    total_count: int = Field(..., alias="totalCount")
+    total_count: int
 
 
 class OwnVideosData(BaseModel):
@@ -221,9 +319,11 @@ class OwnVideosData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v2/users/me/videos
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[OwnVideoItem]
-    total_count: int = Field(..., alias="totalCount")
-    total_item_count: int = Field(..., alias="totalItemCount")
+    total_count: int
+    total_item_count: int
     limitation: OwnVideosLimitation
 
 
@@ -233,12 +333,16 @@ class UserMylistsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/<user_id>/mylists
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     mylists: list[UserMylistItem]
 
 
 class FollowingMylistItem(BaseModel):
     """A class that represents a following mylist item."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id_: int = Field(..., alias="id")
     status: str
     detail: UserMylistItem
@@ -250,15 +354,19 @@ class FollowingMylistsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/following/mylists
     """
 
-    follow_limit: int = Field(..., alias="followLimit")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    follow_limit: int
     mylists: list[FollowingMylistItem]
 
 
 class FollowingTagItem(BaseModel):
     """A class that represents a following tag item."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     name: str
-    followed_at: str = Field(..., alias="followedAt")
+    followed_at: str
     niconic_summary: str | None = Field(None, alias="nicodicSummary")
 
 
@@ -268,6 +376,8 @@ class FollowingTagsData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/following/tags
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     tags: list[FollowingTagItem]
 
 class CreateMylistData(BaseModel):
@@ -276,7 +386,9 @@ class CreateMylistData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/mylists
     """
 
-    mylist_id: int = Field(..., alias="mylistId")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    mylist_id: int
     mylist: Mylist
 
 
@@ -286,7 +398,9 @@ class UserSeriesData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/<user_id>/series
     """
 
-    total_count: int = Field(..., alias="totalCount")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    total_count: int
     items: list[UserSeriesItem]
 
 
@@ -296,7 +410,9 @@ class OwnSeriesData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/series
     """
 
-    total_count: int = Field(..., alias="totalCount")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    total_count: int
     items: list[UserSeriesItem]
     thumbnails: UserSeriesThumbnails
 
@@ -307,9 +423,11 @@ class UserSearchData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/search/user
     """
 
-    request_id: str = Field(..., alias="requestId")
-    total_count: int = Field(..., alias="totalCount")
-    has_next: bool = Field(..., alias="hasNext")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    request_id: str
+    total_count: int
+    has_next: bool
     items: list[UserSearchItem]
 
 
@@ -319,12 +437,16 @@ class ThreadKeyData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/comment/keys/thread?videoId=<video_id>
     """
 
-    thread_key: str = Field(..., alias="threadKey")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    thread_key: str
 
 
 class RecommendRecipe(BaseModel):
     """A class that represents a recipe of a recommend response from the NvAPI."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     id_: str = Field(..., alias="id")
     meta: None
 
@@ -332,15 +454,21 @@ class RecommendRecipe(BaseModel):
 class RecommendReason(BaseModel):
     """A class that represents a reason of a recommend item response from the NvAPI."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     tag: str | None = None
 
 
 class RecommendItem(BaseModel):
     """A class that represents an item of a recommend response from the NvAPI."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     id_: str = Field(..., alias="id")
-    content_type: str = Field(..., alias="contentType")
-    recommend_type: str = Field(..., alias="recommendType")
+    content_type: str
+    recommend_type: str
     # Currently only EssentialVideo is confirmed.
     # We use Any to allow for future variations in format.
     content: EssentialVideo | Any
@@ -353,8 +481,10 @@ class RecommendData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/recommend
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     recipe: RecommendRecipe
-    recommend_id: str = Field(..., alias="recommendId")
+    recommend_id: str
     items: list[RecommendItem]
 
 
@@ -364,14 +494,19 @@ class LikeData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/likes/items?videoId=<video_id>
     """
 
-    thanks_message: str | None = Field(None, alias="thanksMessage")
+    model_config = RESPONSE_MODEL_CONFIG
+
+    thanks_message: str | None = None
 
 
 class LikeHistoryItem(BaseModel):
     """A class that represents a like history item."""
 
-    liked_at: str = Field(..., alias="likedAt")
-    thanks_message: str | None = Field(None, alias="thanksMessage")
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
+    liked_at: datetime
+    thanks_message: str | None = None
     video: EssentialVideo
     status: str
 
@@ -379,9 +514,12 @@ class LikeHistoryItem(BaseModel):
 class LikeHistorySummary(BaseModel):
     """A class that represents the summary of like history."""
 
-    has_next: bool = Field(..., alias="hasNext")
-    can_get_next_page: bool = Field(..., alias="canGetNextPage")
-    get_next_page_ng_reason: str | None = Field(None, alias="getNextPageNgReason")
+    __slots__ = ()
+    model_config = RESPONSE_MODEL_CONFIG
+
+    has_next: bool
+    can_get_next_page: bool
+    get_next_page_ng_reason: str | None = None
 
 
 class LikeHistoryData(BaseModel):
@@ -390,6 +528,8 @@ class LikeHistoryData(BaseModel):
     ref: https://nvapi.nicovideo.jp/v1/users/me/likes
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     items: list[LikeHistoryItem]
     summary: LikeHistorySummary
 
@@ -397,54 +537,72 @@ class LikeHistoryData(BaseModel):
 class ActivityActor(BaseModel):
     """A class that represents an actor in a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     id_: str = Field(..., alias="id")
     type_: str = Field(..., alias="type")
     name: str
-    icon_url: str = Field(..., alias="iconUrl")
+    icon_url: str
     url: str
-    is_live: bool = Field(..., alias="isLive")
+    is_live: bool
 
 
 class ActivityMessage(BaseModel):
     """A class that represents a message in a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     text: str
 
 
 class ActivityLabel(BaseModel):
     """A class that represents a label in a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     text: str
 
 
 class ActivityVideoContent(BaseModel):
     """A class that represents video content in a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     duration: int
 
 
 class ActivityContent(BaseModel):
     """A class that represents content in a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     type_: str = Field(..., alias="type")
     id_: str = Field(..., alias="id")
     title: str
     url: str
-    started_at: str = Field(..., alias="startedAt")
+    started_at: datetime
     video: ActivityVideoContent | None = None
 
 
 class Activity(BaseModel):
     """A class that represents a feed activity."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     sensitive: bool
     message: ActivityMessage
-    thumbnail_url: str = Field(..., alias="thumbnailUrl")
+    thumbnail_url: str
     label: ActivityLabel
     content: ActivityContent
     id_: str = Field(..., alias="id")
     kind: str
-    created_at: str = Field(..., alias="createdAt")
+    created_at: datetime
     actor: ActivityActor
 
 
@@ -454,7 +612,40 @@ class FeedData(BaseModel):
     ref: https://api.feed.nicovideo.jp/v1/activities/followings/publish?context=header_timeline
     """
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     activities: list[Activity]
     code: str
-    impression_id: str = Field(..., alias="impressionId")
-    next_cursor: str | None = Field(None, alias="nextCursor")
+    impression_id: str
+    next_cursor: str | None = None
+
+
+# Parametrized response classes, created once here so that call sites skip NvAPIResponse.__class_getitem__.
+VideosResponse = NvAPIResponse[VideosData]
+TagsResponse = NvAPIResponse[TagsData]
+MylistResponse = NvAPIResponse[MylistData]
+SeriesResponse = NvAPIResponse[SeriesData]
+GenresResponse = NvAPIResponse[GenresData]
+PopularTagsResponse = NvAPIResponse[PopularTagsData]
+RankingResponse = NvAPIResponse[RankingData]
+VideoSearchResponse = NvAPIResponse[VideoSearchData]
+FacetResponse = NvAPIResponse[FacetData]
+ListSearchResponse = NvAPIResponse[ListSearchData]
+AccessRightsResponse = NvAPIResponse[AccessRightsData]
+HistoryResponse = NvAPIResponse[HistoryData]
+UserResponse = NvAPIResponse[UserData]
+OwnUserResponse = NvAPIResponse[OwnUserData]
+RelationshipUsersResponse = NvAPIResponse[RelationshipUsersData]
+UserVideosResponse = NvAPIResponse[UserVideosData]
+OwnVideosResponse = NvAPIResponse[OwnVideosData]
+UserMylistsResponse = NvAPIResponse[UserMylistsData]
+FollowingMylistsResponse = NvAPIResponse[FollowingMylistsData]
+FollowingTagsResponse = NvAPIResponse[FollowingTagsData]
+CreateMylistResponse = NvAPIResponse[CreateMylistData]
+UserSeriesResponse = NvAPIResponse[UserSeriesData]
+OwnSeriesResponse = NvAPIResponse[OwnSeriesData]
+UserSearchResponse = NvAPIResponse[UserSearchData]
+ThreadKeyResponse = NvAPIResponse[ThreadKeyData]
+RecommendResponse = NvAPIResponse[RecommendData]
+LikeResponse = NvAPIResponse[LikeData]
+LikeHistoryResponse = NvAPIResponse[LikeHistoryData]
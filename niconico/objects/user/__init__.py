@@ -6,19 +6,23 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from niconico.objects.common import EssentialChannel, UserIcon
+from niconico.objects.common import ITEM_MODEL_CONFIG, RESPONSE_MODEL_CONFIG, EssentialChannel, UserIcon
 from niconico.objects.video import EssentialVideo, MylistItem, MylistSortKey, MylistSortOrder, Owner
 
 
 class SessionRelationships(BaseModel):
     """A class that represents the relationships of a user in a session."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     is_following: bool = Field(..., alias="isFollowing")
 
 
 class UserRelationships(BaseModel):
     """A class that represents the relationships of a user."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     session_user: SessionRelationships = Field(..., alias="sessionUser")
     is_me: bool = Field(default=False, alias="isMe")
 
@@ -26,6 +30,8 @@ class UserRelationships(BaseModel):
 class UserLevel(BaseModel):
     """A class that represents the level of a user."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     current_level: int = Field(..., alias="currentLevel")
     next_level_threshold_experience: int = Field(..., alias="nextLevelThresholdExperience")
     next_level_experience: int = Field(..., alias="nextLevelExperience")
@@ -35,6 +41,8 @@ class UserLevel(BaseModel):
 class UserSNS(BaseModel):
     """A class that represents the SNS of a user."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     type_: Literal["twitter", "instagram", "youtube", "facebook"] = Field(..., alias="type")
     label: str
     icon_url: str = Field(..., alias="iconUrl")
@@ -45,6 +53,8 @@ class UserSNS(BaseModel):
 class UserCoverImage(BaseModel):
     """A class that represents the cover image of a user."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     ogp_url: str = Field(..., alias="ogpUrl")
     pc_url: str = Field(..., alias="pcUrl")
     smartphone_url: str = Field(..., alias="smartphoneUrl")
@@ -53,6 +63,9 @@ class UserCoverImage(BaseModel):
 class NicoUser(BaseModel):
     """A class that represents a user object."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     description: str
     decorated_description_html: str = Field(..., alias="decoratedDescriptionHtml")
     stripped_description: str = Field(..., alias="strippedDescription")
@@ -73,6 +86,9 @@ class NicoUser(BaseModel):
 class OwnNicoUser(NicoUser):
     """A class that represents the user object of the own user."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     niconico_point: int = Field(..., alias="niconicoPoint")
     language: str
     premium_ticket_expire_time: str | None = Field(..., alias="premiumTicketExpireTime")
@@ -84,6 +100,9 @@ class OwnNicoUser(NicoUser):
 class RelationshipUser(BaseModel):
     """A class that represents a relationship user object."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     type_: Literal["relationship"] = Field(..., alias="type")
     relationships: UserRelationships
     is_premium: bool = Field(..., alias="isPremium")
@@ -98,6 +117,8 @@ class RelationshipUser(BaseModel):
 class RelationshipUsersSummary(BaseModel):
     """A class that represents the summary of a relationship users response from the NvAPI."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     followees: int
     followers: int
     has_next: bool = Field(..., alias="hasNext")
@@ -107,6 +128,9 @@ class RelationshipUsersSummary(BaseModel):
 class VideoItemSeries(BaseModel):
     """A class that represents a series of a video item."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     id_: int = Field(..., alias="id")
     title: str
     order: int
@@ -115,6 +139,9 @@ class VideoItemSeries(BaseModel):
 class UserVideoItem(BaseModel):
     """A class that represents a video item of a user."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     series: VideoItemSeries | None
     essential: EssentialVideo
 
@@ -135,6 +162,8 @@ UserVideosSortOrder = Literal["asc", "desc"]
 class OwnVideosLimitationUser(BaseModel):
     """A class that represents the user of the limitation of own videos."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     uploadable_count: int | None = Field(None, alias="uploadableCount")
     uploaded_count_for_limitation: int | None = Field(None, alias="uploadedCountForLimitation")
 
@@ -142,6 +171,8 @@ class OwnVideosLimitationUser(BaseModel):
 class OwnVideosLimitation(BaseModel):
     """A class that represents the limitation of own videos."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     border_id: int = Field(..., alias="borderId")
     user: OwnVideosLimitationUser
 
@@ -149,6 +180,9 @@ class OwnVideosLimitation(BaseModel):
 class OwnVideoItem(BaseModel):
     """A class that represents a video item of own videos."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     is_capture_tweet_allowed: bool = Field(..., alias="isCaptureTweetAllowed")
     is_clip_tweet_allowed: bool = Field(..., alias="isClipTweetAllowed")
     is_community_member_only: bool = Field(..., alias="isCommunityMemberOnly")
@@ -169,6 +203,9 @@ class OwnVideoItem(BaseModel):
 class UserMylistItem(BaseModel):
     """A class that represents a mylist item of a user."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     id_: int = Field(..., alias="id")
     is_public: bool = Field(..., alias="isPublic")
     name: str
@@ -187,6 +224,9 @@ class UserMylistItem(BaseModel):
 class UserSeriesOwner(BaseModel):
     """A class that represents the owner of a user series item."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     type_: Literal["user"] = Field(..., alias="type")
     id_: str = Field(..., alias="id")
 
@@ -194,6 +234,9 @@ class UserSeriesOwner(BaseModel):
 class UserSeriesItem(BaseModel):
     """A class that represents a series item of a user."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     id_: int = Field(..., alias="id")
     owner: UserSeriesOwner
     title: str
@@ -206,5 +249,7 @@ class UserSeriesItem(BaseModel):
 class UserSeriesThumbnails(BaseModel):
     """A class that represents the thumbnails of a user series."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     default: str
     default_for_owner: str = Field(..., alias="defaultForOwner")
@@ -6,6 +6,7 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+from niconico.objects.common import ITEM_MODEL_CONFIG
 from niconico.objects.user import UserIcon, UserRelationships
 
 UserSearchSortKey = Literal["_personalized", "followerCount", "videoCount", "liveCount"]
@@ -14,6 +15,9 @@ UserSearchSortKey = Literal["_personalized", "followerCount", "videoCount", "liv
 class UserSearchItem(BaseModel):
     """A class that represents an item of a user search response from the NvAPI."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     type_: Literal["userSearch"] = Field(..., alias="type")
     follower_count: int = Field(..., alias="followerCount")
     video_count: int = Field(..., alias="videoCount")
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Literal
 
 from pydantic import BaseModel, Field
 
-from niconico.objects.common import EssentialChannel, EssentialUser
+from niconico.objects.common import ITEM_MODEL_CONFIG, EssentialChannel, EssentialUser
 
 
 class VideoCount(BaseModel):
@@ -165,9 +166,11 @@ class SeriesItem(BaseModel):
 class HistoryItem(BaseModel):
     """A class that represents a history item."""
 
+    model_config = ITEM_MODEL_CONFIG
+
     frontend_id: int = Field(..., alias="frontendId")
     is_maybe_like_user_item: bool = Field(..., alias="isMaybeLikeUserItem")
-    last_viewed_at: str = Field(..., alias="lastViewedAt")
+    last_viewed_at: datetime = Field(..., alias="lastViewedAt")
     playback_position: float = Field(..., alias="playbackPosition")
     video: EssentialVideo
     views: int
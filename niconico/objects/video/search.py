@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from array import array
+from datetime import datetime
+from typing import Generic, Literal, TypeVar
 
 from pydantic import BaseModel, Field
 
+from niconico.objects.common import ITEM_MODEL_CONFIG, RESPONSE_MODEL_CONFIG
 from niconico.objects.video import Owner
 from niconico.objects.video.ranking import Genre
 
@@ -58,6 +61,9 @@ SnapshotSortKey = Literal[
 class RelatedTag(BaseModel):
     """A class that represents a related tag."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     text: str
     type_: str = Field(..., alias="type")
 
@@ -71,6 +77,9 @@ class VideoSearchAdditionals(BaseModel):
 class FacetItem(BaseModel):
     """A class that represents a facet item."""
 
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
     genre: Genre
     count: int
 
@@ -81,64 +90,64 @@ ListType = Literal["mylist", "series"]
 ListSearchSortKey = Literal["_hotTotalScore", "videoCount", "startTime"]
 
 
-class EssentialSeries(BaseModel):
-    """A class that represents an essential series."""
+ListTypeT = TypeVar("ListTypeT", bound=ListType)
 
-    id_: int = Field(..., alias="id")
-    type_: Literal["series"] = Field(..., alias="type")
-    title: str
-    description: str
-    thumbnail_url: str = Field(..., alias="thumbnailUrl")
-    video_count: int = Field(..., alias="videoCount")
-    owner: Owner
-    is_muted: bool = Field(..., alias="isMuted")
-    is_following: bool = Field(..., alias="isFollowing")
-    follower_count: int = Field(..., alias="followerCount")
 
+class EssentialList(BaseModel, Generic[ListTypeT]):
+    """A class that represents an essential list, parametrized by its list type."""
 
-class EssentialMylist(BaseModel):
-    """A class that represents an essential mylist."""
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
 
     id_: int = Field(..., alias="id")
-    type_: Literal["mylist"] = Field(..., alias="type")
+    type_: ListTypeT = Field(..., alias="type")
     title: str
     description: str
-    thumbnail_url: str = Field(..., alias="thumbnailUrl")
-    video_count: int = Field(..., alias="videoCount")
+    thumbnail_url: str
+    video_count: int
     owner: Owner
-    is_muted: bool = Field(..., alias="isMuted")
-    is_following: bool = Field(..., alias="isFollowing")
-    follower_count: int = Field(..., alias="followerCount")
+    is_muted: bool
+    is_following: bool
+    follower_count: int
+
+
+EssentialSeries = EssentialList[Literal["series"]]
+EssentialMylist = EssentialList[Literal["mylist"]]
 
 
 class SnapshotSearchMeta(BaseModel):
     """A class that represents the meta information of a snapshot search response."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: int
-    total_count: int = Field(..., alias="totalCount")
+    total_count: int
     id_: str = Field(..., alias="id")
-    error_code: str | None = Field(None, alias="errorCode")
-    error_message: str | None = Field(None, alias="errorMessage")
+    error_code: str | None = None
+    error_message: str | None = None
 
 
 class SnapshotVideoItem(BaseModel):
     """A class that represents a video item from snapshot search response."""
 
-    content_id: str | None = Field(None, alias="contentId")
+    __slots__ = ()
+    model_config = ITEM_MODEL_CONFIG
+
+    content_id: str | None = None
     title: str | None = None
     description: str | None = None
-    user_id: int | None = Field(None, alias="userId")
-    channel_id: int | None = Field(None, alias="channelId")
-    view_counter: int | None = Field(None, alias="viewCounter")
-    mylist_counter: int | None = Field(None, alias="mylistCounter")
-    like_counter: int | None = Field(None, alias="likeCounter")
-    length_seconds: int | None = Field(None, alias="lengthSeconds")
-    thumbnail_url: str | None = Field(None, alias="thumbnailUrl")
-    start_time: str | None = Field(None, alias="startTime")
-    last_res_body: str | None = Field(None, alias="lastResBody")
-    comment_counter: int | None = Field(None, alias="commentCounter")
-    last_comment_time: str | None = Field(None, alias="lastCommentTime")
-    category_tags: str | None = Field(None, alias="categoryTags")
+    user_id: int | None = None
+    channel_id: int | None = None
+    view_counter: int | None = None
+    mylist_counter: int | None = None
+    like_counter: int | None = None
+    length_seconds: int | None = None
+    thumbnail_url: str | None = None
+    start_time: datetime | None = None
+    last_res_body: str | None = None
+    comment_counter: int | None = None
+    last_comment_time: datetime | None = None
+    category_tags: str | None = None
     tags: str | None = None
     genre: str | None = None
 
@@ -148,3 +157,58 @@ class SnapshotSearchResponse(BaseModel):
 
     meta: SnapshotSearchMeta
     data: list[SnapshotVideoItem]
+
+
+class SnapshotBatch:
+    """A class that represents the items of a snapshot search response as columns.
+
+    Numeric counters are stored in contiguous ``array("q")`` buffers, which keeps column-wise scans
+    (``sum``, ``max``, filtering by index) over large result sets cheap. Missing values, e.g. fields
+    that were not requested, are stored as -1.
+    """
+
+    __slots__ = (
+        "comment_counter",
+        "content_id",
+        "length_seconds",
+        "like_counter",
+        "mylist_counter",
+        "view_counter",
+    )
+
+    content_id: list[str | None]
+    view_counter: array[int]
+    mylist_counter: array[int]
+    like_counter: array[int]
+    comment_counter: array[int]
+    length_seconds: array[int]
+
+    def __init__(self, items: list[SnapshotVideoItem]) -> None:
+        """Initialize the batch from snapshot video items."""
+        self.content_id = [item.content_id for item in items]
+        self.view_counter = self._column(items, "view_counter")
+        self.mylist_counter = self._column(items, "mylist_counter")
+        self.like_counter = self._column(items, "like_counter")
+        self.comment_counter = self._column(items, "comment_counter")
+        self.length_seconds = self._column(items, "length_seconds")
+
+    def __len__(self) -> int:
+        """Return the number of items in the batch."""
+        return len(self.content_id)
+
+    @classmethod
+    def from_response(cls, response: SnapshotSearchResponse) -> SnapshotBatch:
+        """Create a batch from a snapshot search response.
+
+        Args:
+            response (SnapshotSearchResponse): The snapshot search response.
+
+        Returns:
+            SnapshotBatch: The items of the response as columns.
+        """
+        return cls(response.data)
+
+    @staticmethod
+    def _column(items: list[SnapshotVideoItem], name: str) -> array[int]:
+        values = (getattr(item, name) for item in items)
+        return array("q", (-1 if value is None else value for value in values))
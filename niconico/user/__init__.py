@@ -2,45 +2,84 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal
 
 import requests
 
 from niconico.base.client import BaseClient
-from niconico.decorators import login_required
+from niconico.decorators import cached, login_required
 from niconico.objects.nvapi import (
-    CreateMylistData,
+    CreateMylistResponse,
     FeedData,
-    FollowingMylistsData,
-    FollowingTagsData,
-    MylistData,
-    NvAPIResponse,
-    OwnSeriesData,
-    OwnUserData,
-    OwnVideosData,
-    RecommendData,
-    RelationshipUsersData,
-    SeriesData,
-    UserData,
-    UserMylistsData,
-    UserSeriesData,
-    UserVideosData,
+    FollowingMylistsResponse,
+    FollowingTagsResponse,
+    MylistResponse,
+    OwnSeriesResponse,
+    OwnUserResponse,
+    OwnVideosResponse,
+    RecommendResponse,
+    RelationshipUsersResponse,
+    SeriesResponse,
+    UserMylistsResponse,
+    UserResponse,
+    UserSeriesResponse,
+    UserVideosResponse,
+    extract_user_video_fields,
+    parse_nvapi,
 )
 from niconico.user.search import UserSearchClient
-from niconico.utils import add_optional_param
+from niconico.utils import build_query, gather_pages, iter_pages
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from niconico.niconico import NicoNico
+    from niconico.objects.nvapi import (
+        CreateMylistData,
+        FollowingMylistsData,
+        FollowingTagsData,
+        OwnVideosData,
+        RecommendData,
+        RelationshipUsersData,
+        SeriesData,
+        UserVideosData,
+    )
     from niconico.objects.user import (
         NicoUser,
         OwnNicoUser,
+        OwnVideoItem,
+        RelationshipUser,
         UserMylistItem,
         UserSeriesItem,
+        UserVideoItem,
         UserVideosSortKey,
         UserVideosSortOrder,
     )
     from niconico.objects.video import Mylist, MylistSortKey, MylistSortOrder
 
+_USER_URL = "https://nvapi.nicovideo.jp/v1/users/{user_id}"
+_USER_FOLLOWERS_URL = _USER_URL + "/followed-by/users"
+_USER_FOLLOWINGS_URL = _USER_URL + "/following/users"
+_USER_VIDEOS_URL = "https://nvapi.nicovideo.jp/v3/users/{user_id}/videos"
+_USER_MYLISTS_URL = _USER_URL + "/mylists"
+_USER_SERIES_URL = _USER_URL + "/series"
+_FOLLOWEE_URL = "https://user-follow-api.nicovideo.jp/v1/user/followees/niconico-users/{user_id}.json"
+_OWN_URL = "https://nvapi.nicovideo.jp/v1/users/me"
+_OWN_FOLLOWERS_URL = _OWN_URL + "/followed-by/users"
+_OWN_FOLLOWINGS_URL = _OWN_URL + "/following/users"
+_OWN_VIDEOS_URL = "https://nvapi.nicovideo.jp/v2/users/me/videos"
+_OWN_MYLISTS_URL = _OWN_URL + "/mylists"
+_OWN_MYLIST_URL = _OWN_MYLISTS_URL + "/{mylist_id}"
+_OWN_MYLIST_ITEMS_URL = _OWN_MYLIST_URL + "/items"
+_OWN_SERIES_LIST_URL = _OWN_URL + "/series"
+_OWN_SERIES_URL = _OWN_SERIES_LIST_URL + "/{series_id}"
+_OWN_FOLLOWING_MYLISTS_URL = _OWN_URL + "/following/mylists"
+_OWN_FOLLOWING_TAGS_URL = _OWN_URL + "/following/tags"
+_RECOMMEND_URL = "https://nvapi.nicovideo.jp/v1/recommend"
+_FOLLOWING_ACTIVITIES_URL = "https://api.feed.nicovideo.jp/v1/activities/followings/{endpoint}"
+
+
 class UserClient(BaseClient):
     """A class that represents a user client."""
 
@@ -51,6 +90,7 @@ class UserClient(BaseClient):
         super().__init__(niconico)
         self.search = UserSearchClient(niconico)
 
+    @cached()
     def get_user(self, user_id: str) -> NicoUser | None:
         """Get a user by its ID.
 
@@ -60,12 +100,8 @@ class UserClient(BaseClient):
         Returns:
             NicoUser | None: The user object if found, None otherwise.
         """
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/{user_id}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.user
-        return None
+        data = self._get_data(_USER_URL.format(user_id=user_id), UserResponse, conditional=True)
+        return None if data is None else data.user
 
     def get_user_followers(self, user_id: str, *, page_size: int = 25, page: int = 1) -> RelationshipUsersData | None:
         """Get the followers of a user by its ID.
@@ -78,14 +114,8 @@ class UserClient(BaseClient):
         Returns:
             RelationshipUsersData | None: The list of followers if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/{user_id}/followed-by/users?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RelationshipUsersData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"pageSize": page_size, "page": page}
+        return self._get_data(_USER_FOLLOWERS_URL.format(user_id=user_id), RelationshipUsersResponse, params=query)
 
     def get_user_followings(self, user_id: str, *, page_size: int = 25, page: int = 1) -> RelationshipUsersData | None:
         """Get the followings of a user by its ID.
@@ -98,14 +128,52 @@ class UserClient(BaseClient):
         Returns:
             RelationshipUsersData | None: The list of followings if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/{user_id}/following/users?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RelationshipUsersData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"pageSize": page_size, "page": page}
+        return self._get_data(_USER_FOLLOWINGS_URL.format(user_id=user_id), RelationshipUsersResponse, params=query)
+
+    async def get_all_user_followers_async(
+        self,
+        user_id: str,
+        *,
+        page_size: int = 100,
+    ) -> list[RelationshipUser] | None:
+        """Get all followers of a user by its ID, fetching the pages concurrently.
+
+        Args:
+            user_id (str): The ID of the user.
+            page_size (int): The number of followers to get per request.
+
+        Returns:
+            list[RelationshipUser] | None: The list of all followers, or None if any page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[RelationshipUser], int] | None:
+            data = self.get_user_followers(user_id, page_size=page_size, page=page)
+            return None if data is None else (data.items, data.summary.followers)
+
+        return await gather_pages(fetch_page, page_size=page_size)
+
+    async def get_all_user_followings_async(
+        self,
+        user_id: str,
+        *,
+        page_size: int = 100,
+    ) -> list[RelationshipUser] | None:
+        """Get all followings of a user by its ID, fetching the pages concurrently.
+
+        Args:
+            user_id (str): The ID of the user.
+            page_size (int): The number of followings to get per request.
+
+        Returns:
+            list[RelationshipUser] | None: The list of all followings, or None if any page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[RelationshipUser], int] | None:
+            data = self.get_user_followings(user_id, page_size=page_size, page=page)
+            return None if data is None else (data.items, data.summary.followees)
+
+        return await gather_pages(fetch_page, page_size=page_size)
 
     def get_user_videos(
         self,
@@ -130,22 +198,92 @@ class UserClient(BaseClient):
         Returns:
             UserVideosData | None: The list of videos if found, None otherwise.
         """
-        query = {
-            "sortKey": sort_key,
-            "sortOrder": sort_order,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if sensitive_contents is not None:
-            query["sensitiveContents"] = sensitive_contents
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v3/users/{user_id}/videos?{query_str}")
+        query = build_query(
+            {
+                "sortKey": sort_key,
+                "sortOrder": sort_order,
+                "pageSize": page_size,
+                "page": page,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
+        return self._get_data(_USER_VIDEOS_URL.format(user_id=user_id), UserVideosResponse, params=query)
+
+    def get_user_videos_fields(
+        self,
+        user_id: str,
+        fields: tuple[str, ...],
+        *,
+        sort_key: UserVideosSortKey = "registeredAt",
+        sort_order: UserVideosSortOrder = "asc",
+        page_size: int = 30,
+        page: int = 1,
+        sensitive_contents: Literal["mask", "filter"] | None = None,
+    ) -> list[dict[str, Any]] | None:
+        """Get only some fields of the videos of a user by its ID, without building the video models.
+
+        Args:
+            user_id (str): The ID of the user.
+            fields (tuple[str, ...]): The camelCase keys to get from each video, e.g. ``("id", "title")``.
+            sort_key (UserVideosSortKey): The key to sort the videos by.
+            sort_order (UserVideosSortOrder): The order to sort the videos by.
+            page_size (int): The number of videos to get per page.
+            page (int): The page number to get the videos from.
+            sensitive_contents (Literal["mask", "filter"] | None): The sensitive contents to get.
+
+        Returns:
+            list[dict[str, Any]] | None: The requested fields of each video if found, None otherwise.
+        """
+        query = build_query(
+            {
+                "sortKey": sort_key,
+                "sortOrder": sort_order,
+                "pageSize": page_size,
+                "page": page,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
+        res = self.niconico.get(_USER_VIDEOS_URL.format(user_id=user_id), params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserVideosData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
+            return extract_user_video_fields(res.content, fields)
         return None
 
+    async def get_all_user_videos_async(
+        self,
+        user_id: str,
+        *,
+        sort_key: UserVideosSortKey = "registeredAt",
+        sort_order: UserVideosSortOrder = "asc",
+        page_size: int = 100,
+        sensitive_contents: Literal["mask", "filter"] | None = None,
+    ) -> list[UserVideoItem] | None:
+        """Get all videos of a user by its ID, fetching the pages concurrently.
+
+        Args:
+            user_id (str): The ID of the user.
+            sort_key (UserVideosSortKey): The key to sort the videos by.
+            sort_order (UserVideosSortOrder): The order to sort the videos by.
+            page_size (int): The number of videos to get per request.
+            sensitive_contents (Literal["mask", "filter"] | None): The sensitive contents to get.
+
+        Returns:
+            list[UserVideoItem] | None: The list of all videos, or None if any page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[UserVideoItem], int] | None:
+            data = self.get_user_videos(
+                user_id,
+                sort_key=sort_key,
+                sort_order=sort_order,
+                page_size=page_size,
+                page=page,
+                sensitive_contents=sensitive_contents,
+            )
+            return None if data is None else (data.items, data.total_count)
+
+        return await gather_pages(fetch_page, page_size=page_size)
+
+    @cached()
     def get_user_mylists(self, user_id: str, *, sample_item_count: int = 0) -> list[UserMylistItem]:
         """Get the mylists of a user by its ID.
 
@@ -156,15 +294,16 @@ class UserClient(BaseClient):
         Returns:
             list[UserMylistItem]: The list of mylists if found, an empty list otherwise.
         """
-        query = {"sampleItemCount": str(sample_item_count)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/{user_id}/mylists?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserMylistsData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.mylists
-        return []
-
+        query = {"sampleItemCount": sample_item_count}
+        data = self._get_data(
+            _USER_MYLISTS_URL.format(user_id=user_id),
+            UserMylistsResponse,
+            params=query,
+            conditional=True,
+        )
+        return [] if data is None else data.mylists
+
+    @cached()
     def get_user_series(self, user_id: str, *, page_size: int = 100, page: int = 1) -> list[UserSeriesItem]:
         """Get the series of a user by its ID.
 
@@ -176,28 +315,74 @@ class UserClient(BaseClient):
         Returns:
             list[UserSeriesData] | None: The list of series if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/{user_id}/series?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserSeriesData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.items
-        return []
+        query = {"pageSize": page_size, "page": page}
+        data = self._get_data(_USER_SERIES_URL.format(user_id=user_id), UserSeriesResponse, params=query)
+        return [] if data is None else data.items
+
+    async def get_all_user_series_async(self, user_id: str, *, page_size: int = 100) -> list[UserSeriesItem] | None:
+        """Get all series of a user by its ID, fetching the pages concurrently.
+
+        Args:
+            user_id (str): The ID of the user.
+            page_size (int): The number of series to get per request.
+
+        Returns:
+            list[UserSeriesItem] | None: The list of all series, or None if any page could not be fetched.
+        """
+        url = _USER_SERIES_URL.format(user_id=user_id)
+
+        def fetch_page(page: int) -> tuple[list[UserSeriesItem], int] | None:
+            data = self._get_data(url, UserSeriesResponse, params={"pageSize": page_size, "page": page})
+            return None if data is None else (data.items, data.total_count)
+
+        return await gather_pages(fetch_page, page_size=page_size)
+
+    def iter_user_series(
+        self,
+        user_id: str,
+        *,
+        page_size: int = 100,
+        prefetch: bool = False,
+    ) -> Iterator[UserSeriesItem]:
+        """Iterate over all series of a user by its ID, fetching each page only when it is reached.
+
+        Args:
+            user_id (str): The ID of the user.
+            page_size (int): The number of series to get per request.
+            prefetch (bool): Whether to fetch the next page in the background while the current one is consumed.
+
+        Yields:
+            UserSeriesItem: The series of the user, in order.
+
+        Raises:
+            NicoAPIError: If a page could not be fetched.
+        """
+        url = _USER_SERIES_URL.format(user_id=user_id)
+
+        def fetch_page(page: int) -> tuple[list[UserSeriesItem], bool] | None:
+            data = self._get_data(url, UserSeriesResponse, params={"pageSize": page_size, "page": page})
+            return None if data is None else (data.items, page * page_size < data.total_count)
+
+        return iter_pages(fetch_page, prefetch=prefetch)
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop every cached response about a user.
+
+        Args:
+            user_id (str): The ID of the user.
+        """
+        self.cache.evict(lambda key: key[1][:1] == (user_id,) or ("user_id", user_id) in key[2])
 
     @login_required()
+    @cached()
     def get_own(self) -> OwnNicoUser | None:
         """Get the own user.
 
         Returns:
             OwnNicoUser | None: The own user object if found, None otherwise.
         """
-        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/users/me")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[OwnUserData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.user
-        return None
+        data = self._get_data(_OWN_URL, OwnUserResponse)
+        return None if data is None else data.user
 
     @login_required()
     def get_own_followers(self, *, page_size: int = 25, page: int = 1) -> RelationshipUsersData | None:
@@ -210,14 +395,8 @@ class UserClient(BaseClient):
         Returns:
             RelationshipUsersData | None: The list of followers if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/followed-by/users?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RelationshipUsersData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"pageSize": page_size, "page": page}
+        return self._get_data(_OWN_FOLLOWERS_URL, RelationshipUsersResponse, params=query)
 
     @login_required()
     def get_own_followings(self, *, page_size: int = 25, page: int = 1) -> RelationshipUsersData | None:
@@ -230,14 +409,8 @@ class UserClient(BaseClient):
         Returns:
             RelationshipUsersData | None: The list of followings if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/following/users?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RelationshipUsersData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"pageSize": page_size, "page": page}
+        return self._get_data(_OWN_FOLLOWINGS_URL, RelationshipUsersResponse, params=query)
 
     @login_required()
     def follow_user(self, user_id: str) -> bool:
@@ -249,7 +422,8 @@ class UserClient(BaseClient):
         Returns:
             bool: True if the user was successfully followed, False otherwise.
         """
-        res = self.niconico.post(f"https://user-follow-api.nicovideo.jp/v1/user/followees/niconico-users/{user_id}.json")
+        res = self.niconico.post(_FOLLOWEE_URL.format(user_id=user_id))
+        self.invalidate_user(user_id)
         return res.status_code == requests.codes.ok
 
     @login_required()
@@ -262,7 +436,8 @@ class UserClient(BaseClient):
         Returns:
             bool: True if the user was successfully unfollowed, False otherwise.
         """
-        res = self.niconico.delete(f"https://user-follow-api.nicovideo.jp/v1/user/followees/niconico-users/{user_id}.json")
+        res = self.niconico.delete(_FOLLOWEE_URL.format(user_id=user_id))
+        self.invalidate_user(user_id)
         return res.status_code == requests.codes.ok
 
     @login_required()
@@ -287,21 +462,49 @@ class UserClient(BaseClient):
         Returns:
             OwnVideosData | None: The list of own videos if found, None otherwise.
         """
-        query = {
-            "sortKey": sort_key,
-            "sortOrder": sort_order,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if sensitive_contents is not None:
-            query["sensitiveContents"] = sensitive_contents
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/users/me/videos?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[OwnVideosData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = build_query(
+            {
+                "sortKey": sort_key,
+                "sortOrder": sort_order,
+                "pageSize": page_size,
+                "page": page,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
+        return self._get_data(_OWN_VIDEOS_URL, OwnVideosResponse, params=query)
+
+    @login_required()
+    async def get_all_own_videos_async(
+        self,
+        *,
+        sort_key: UserVideosSortKey = "registeredAt",
+        sort_order: UserVideosSortOrder = "asc",
+        page_size: int = 100,
+        sensitive_contents: Literal["mask", "filter"] | None = None,
+    ) -> list[OwnVideoItem] | None:
+        """Get all own videos, fetching the pages concurrently.
+
+        Args:
+            sort_key (UserVideosSortKey): The key to sort the videos by.
+            sort_order (UserVideosSortOrder): The order to sort the videos by.
+            page_size (int): The number of videos to get per request.
+            sensitive_contents (Literal["mask", "filter"] | None): The sensitive contents to get.
+
+        Returns:
+            list[OwnVideoItem] | None: The list of all own videos, or None if any page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[OwnVideoItem], int] | None:
+            data = self.get_own_videos(
+                sort_key=sort_key,
+                sort_order=sort_order,
+                page_size=page_size,
+                page=page,
+                sensitive_contents=sensitive_contents,
+            )
+            return None if data is None else (data.items, data.total_count)
+
+        return await gather_pages(fetch_page, page_size=page_size)
 
     @login_required()
     def get_own_mylist(
@@ -321,16 +524,12 @@ class UserClient(BaseClient):
         Returns:
             Mylist | None: The mylist object if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/mylists/{mylist_id}?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[MylistData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.mylist
-        return None
+        query = {"pageSize": page_size, "page": page}
+        data = self._get_data(_OWN_MYLIST_URL.format(mylist_id=mylist_id), MylistResponse, params=query)
+        return None if data is None else data.mylist
 
     @login_required()
+    @cached()
     def get_own_mylists(self, *, sample_item_count: int = 0) -> list[UserMylistItem]:
         """Get the own mylists.
 
@@ -340,14 +539,17 @@ class UserClient(BaseClient):
         Returns:
             list[UserMylistItem]: The list of own mylists if found, an empty list otherwise.
         """
-        query = {"sampleItemCount": str(sample_item_count)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/mylists?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserMylistsData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.mylists
-        return []
+        query = {"sampleItemCount": sample_item_count}
+        data = self._get_data(_OWN_MYLISTS_URL, UserMylistsResponse, params=query)
+        return [] if data is None else data.mylists
+
+    def _invalidate_own_mylists(self) -> None:
+        """Drop the cached own mylists after they were modified.
+
+        Cached get_user_mylists results are dropped too, since one of them may be the own user's
+        and the own user ID is not known without a request.
+        """
+        self.cache.evict(lambda key: key[0] in ("get_own_mylists", "get_user_mylists"))
 
     @login_required()
     def add_mylist_item(self, mylist_id: str, item_id: str) -> bool:
@@ -360,23 +562,61 @@ class UserClient(BaseClient):
         Returns:
             bool: True if the video was successfully added, False otherwise.
         """
-        res = self.niconico.post(f"https://nvapi.nicovideo.jp/v1/users/me/mylists/{mylist_id}/items?itemId={item_id}")
+        res = self.niconico.post(_OWN_MYLIST_ITEMS_URL.format(mylist_id=mylist_id), params={"itemId": item_id})
+        self._invalidate_own_mylists()
         return res.status_code == requests.codes.created
 
     @login_required()
-    def remove_mylist_items(self, mylist_id: str, item_ids: list[str]) -> bool:
+    def add_mylist_items(self, mylist_id: str, item_ids: list[str], *, concurrency: int = 8) -> list[bool]:
+        """Add multiple videos to a mylist.
+
+        The API takes one video per request, so the requests are sent concurrently over the shared session.
+
+        Args:
+            mylist_id (str): The ID of the mylist to add the videos to.
+            item_ids (list[str]): The IDs of the videos to add to the mylist.
+            concurrency (int): The maximum number of requests in flight at once.
+
+        Returns:
+            list[bool]: Whether each video was successfully added, in the order of item_ids.
+        """
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(lambda item_id: self.add_mylist_item(mylist_id, item_id), item_ids))
+
+    @login_required()
+    def remove_mylist_items(
+        self,
+        mylist_id: str,
+        item_ids: list[str],
+        *,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+    ) -> bool:
         """Remove multiple videos from a mylist.
 
+        The IDs are sent in chunks so that the request URLs stay short, and the chunks are removed concurrently.
+
         Args:
             mylist_id (str): The ID of the mylist to remove the videos from.
             item_ids (list[str]): The IDs of the videos to remove from the mylist.
+            chunk_size (int): The maximum number of IDs per request.
+            concurrency (int): The maximum number of requests in flight at once.
 
         Returns:
             bool: True if the videos were successfully removed, False otherwise.
         """
-        item_ids_str = ",".join(item_ids)
-        res = self.niconico.delete(f"https://nvapi.nicovideo.jp/v1/users/me/mylists/{mylist_id}/items?itemIds={item_ids_str}")
-        return res.status_code == requests.codes.ok
+        url = _OWN_MYLIST_ITEMS_URL.format(mylist_id=mylist_id)
+        chunks = [item_ids[i : i + chunk_size] for i in range(0, len(item_ids), chunk_size)] or [[]]
+
+        def remove_chunk(chunk: list[str]) -> bool:
+            res = self.niconico.delete(url, params={"itemIds": ",".join(chunk)})
+            self._invalidate_own_mylists()
+            return res.status_code == requests.codes.ok
+
+        if len(chunks) == 1:
+            return remove_chunk(chunks[0])
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return all(list(executor.map(remove_chunk, chunks)))
 
     @login_required()
     def create_mylist(
@@ -407,9 +647,10 @@ class UserClient(BaseClient):
             "defaultSortKey": default_sort_key,
             "defaultSortOrder": default_sort_order,
         }
-        res = self.niconico.post("https://nvapi.nicovideo.jp/v1/users/me/mylists", data=data)
+        res = self.niconico.post(_OWN_MYLISTS_URL, data=data)
+        self._invalidate_own_mylists()
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[CreateMylistData](**res.json())
+            res_cls = parse_nvapi(CreateMylistResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -426,16 +667,11 @@ class UserClient(BaseClient):
         Returns:
             SeriesData | None: The series object if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/series/{series_id}?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[SeriesData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"pageSize": page_size, "page": page}
+        return self._get_data(_OWN_SERIES_URL.format(series_id=series_id), SeriesResponse, params=query)
 
     @login_required()
+    @cached()
     def get_own_series(self, *, page_size: int = 100, page: int = 1) -> list[UserSeriesItem]:
         """Get the series list of the own user.
 
@@ -446,14 +682,47 @@ class UserClient(BaseClient):
         Returns:
             list[UserSeriesItem]: The list of series if found, an empty list otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/series?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[OwnSeriesData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.items
-        return []
+        query = {"pageSize": page_size, "page": page}
+        data = self._get_data(_OWN_SERIES_LIST_URL, OwnSeriesResponse, params=query)
+        return [] if data is None else data.items
+
+    @login_required()
+    async def get_all_own_series_async(self, *, page_size: int = 100) -> list[UserSeriesItem] | None:
+        """Get all series of the own user, fetching the pages concurrently.
+
+        Args:
+            page_size (int): The number of series to get per request.
+
+        Returns:
+            list[UserSeriesItem] | None: The list of all series, or None if any page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[UserSeriesItem], int] | None:
+            data = self._get_data(_OWN_SERIES_LIST_URL, OwnSeriesResponse, params={"pageSize": page_size, "page": page})
+            return None if data is None else (data.items, data.total_count)
+
+        return await gather_pages(fetch_page, page_size=page_size)
+
+    @login_required()
+    def iter_own_series(self, *, page_size: int = 100, prefetch: bool = False) -> Iterator[UserSeriesItem]:
+        """Iterate over all series of the own user, fetching each page only when it is reached.
+
+        Args:
+            page_size (int): The number of series to get per request.
+            prefetch (bool): Whether to fetch the next page in the background while the current one is consumed.
+
+        Yields:
+            UserSeriesItem: The series of the own user, in order.
+
+        Raises:
+            NicoAPIError: If a page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[UserSeriesItem], bool] | None:
+            data = self._get_data(_OWN_SERIES_LIST_URL, OwnSeriesResponse, params={"pageSize": page_size, "page": page})
+            return None if data is None else (data.items, page * page_size < data.total_count)
+
+        return iter_pages(fetch_page, prefetch=prefetch)
 
     @login_required()
     def get_own_following_mylists(self, *, sample_item_count: int = 0) -> FollowingMylistsData | None:
@@ -465,14 +734,8 @@ class UserClient(BaseClient):
         Returns:
             FollowingMylistsData | None: The following mylists data if found, None otherwise.
         """
-        query = {"sampleItemCount": str(sample_item_count)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/following/mylists?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[FollowingMylistsData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        query = {"sampleItemCount": sample_item_count}
+        return self._get_data(_OWN_FOLLOWING_MYLISTS_URL, FollowingMylistsResponse, params=query)
 
     @login_required()
     def get_own_following_tags(self) -> FollowingTagsData | None:
@@ -481,16 +744,15 @@ class UserClient(BaseClient):
         Returns:
             FollowingTagsData | None: The following tags data if found, None otherwise.
         """
-        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/users/me/following/tags")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[FollowingTagsData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        return self._get_data(_OWN_FOLLOWING_TAGS_URL, FollowingTagsResponse)
 
     def get_recommendations(
         self,
-        recipe_id: str = Literal["video_watch_recommendation", "video_recommendation_recommend" , "video_top_recommend"],
+        recipe_id: Literal[
+            "video_watch_recommendation",
+            "video_recommendation_recommend",
+            "video_top_recommend",
+        ] = "video_watch_recommendation",
         *,
         video_id: str | None = None,
         site: str = "nicovideo",
@@ -502,7 +764,7 @@ class UserClient(BaseClient):
         """Get recommendations based on a specific video or general recommendations.
 
         Args:
-            recipe_id (str): The ID of the recommendation recipe.
+            recipe_id (str): The ID of the recommendation recipe. Defaults to "video_watch_recommendation".
             video_id (str | None): The ID of the video to base the recommendations on.
             site (str): The site to get recommendations from. Defaults to "nicovideo".
             limit (int | None): The maximum number of recommendations to return.
@@ -513,26 +775,23 @@ class UserClient(BaseClient):
         Returns:
             RecommendData | None: The recommendation data if found, None otherwise.
         """
-        query: dict[str, str] = {"recipeId": recipe_id, "site": site}
-
-        # Set defaults and add video_id if provided
+        # Recommendations based on a video default to 25 items
         if video_id is not None:
-            query["videoId"] = video_id
             limit = limit or 25
 
-        # Build query parameters
-        add_optional_param(query, "recipeVersion", recipe_version)
-        add_optional_param(query, "limit", limit)
-        add_optional_param(query, "with_reason", "true" if with_reason else None)
-        add_optional_param(query, "sensitiveContents", sensitive_contents)
+        query = build_query(
+            {
+                "recipeId": recipe_id,
+                "site": site,
+                "videoId": video_id,
+                "recipeVersion": recipe_version,
+                "limit": limit,
+                "with_reason": "true" if with_reason else None,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
 
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/recommend?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RecommendData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        return self._get_data(_RECOMMEND_URL, RecommendResponse, params=query)
 
     @login_required()
     def get_following_activities(
@@ -554,16 +813,9 @@ class UserClient(BaseClient):
         Returns:
             FeedData | None: The feed data if successful, None otherwise.
         """
-        base_url = "https://api.feed.nicovideo.jp/v1/activities/followings"
-        url = f"{base_url}/{endpoint}"
-
-        query = {"context": context}
-        if cursor is not None:
-            query["cursor"] = cursor
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-
-        res = self.niconico.get(f"{url}?{query_str}")
+        query = build_query({"context": context, "cursor": cursor})
+        res = self.niconico.get(_FOLLOWING_ACTIVITIES_URL.format(endpoint=endpoint), params=query)
         if res.status_code == requests.codes.ok:
-            return FeedData(**res.json())
+            return parse_nvapi(FeedData, res.content)
         return None
 
@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING
 import requests
 
 from niconico.base.client import BaseClient
-from niconico.objects.nvapi import NvAPIResponse, UserSearchData
+from niconico.objects.nvapi import UserSearchResponse, parse_nvapi
 
 if TYPE_CHECKING:
+    from niconico.objects.nvapi import UserSearchData
     from niconico.objects.user.search import UserSearchSortKey
 
 
@@ -35,16 +36,15 @@ class UserSearchClient(BaseClient):
         Returns:
             UserSearchData | None: User search data.
         """
-        query = {
+        query: dict[str, str | int] = {
             "keyword": keyword,
             "sortKey": sort_key,
             "pageSize": page_size,
             "page": page,
         }
-        query_str = "&".join(f"{key}={value}" for key, value in query.items())
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/search/user?{query_str}")
+        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/search/user", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[UserSearchData](**res.json())
+            res_cls = parse_nvapi(UserSearchResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -2,7 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Generic, Hashable, TypeVar
+
+from niconico.exceptions import NicoAPIError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# A prefixed video ID anywhere in the URL, or a bare numeric ID right after /watch/.
+VIDEO_ID_PATTERN = re.compile(r"(?:sm|nm|so)\d+|(?<=/watch/)\d+")
 
 
 def extract_video_id_from_url(url: str) -> str | None:
@@ -14,12 +32,154 @@ def extract_video_id_from_url(url: str) -> str | None:
     Returns:
         str | None: Extracted video ID or None if not found.
     """
-    match = re.search(r"(?:sm|nm|so)?\d+", url)
+    match = VIDEO_ID_PATTERN.search(url)
     if match:
         return match.group(0)
     return None
 
-def add_optional_param(query: dict[str, str], key: str, value: int | str | None) -> None:
-    """Add an optional parameter to the query dict if value is not None."""
-    if value is not None:
-        query[key] = str(value)
+class TTLCache(Generic[K]):
+    """A thread-safe mapping whose entries expire after a fixed time and are evicted least recently used first."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries to keep.
+            ttl (float): The number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K, default: Any = None) -> Any:  # noqa: ANN401
+        """Get the value of a key if it exists and has not expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: K, value: Any) -> None:  # noqa: ANN401
+        """Set the value of a key, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def evict(self, predicate: Callable[[K], bool]) -> None:
+        """Remove every entry whose key matches the predicate."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def extract_video_ids_from_urls(urls: Iterable[str]) -> list[str | None]:
+    """Extract video IDs from many URLs.
+
+    Args:
+        urls (Iterable[str]): URLs to extract video IDs from.
+
+    Returns:
+        list[str | None]: Extracted video ID of each URL, or None for the ones where none was found.
+    """
+    return [match.group(0) if match else None for match in map(VIDEO_ID_PATTERN.search, urls)]
+
+
+def build_query(params: dict[str, str | int | None]) -> dict[str, str | int]:
+    """Build query parameters for a request, dropping the ones whose value is None.
+
+    Args:
+        params (dict[str, str | int | None]): The query parameters, with None for the optional ones that are unset.
+
+    Returns:
+        dict[str, str | int]: The query parameters that are set.
+    """
+    return {key: value for key, value in params.items() if value is not None}
+
+
+def iter_pages(
+    fetch_page: Callable[[int], tuple[Sequence[T], bool] | None],
+    *,
+    page: int = 1,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """Iterate over the items of a paginated endpoint, fetching each page only when it is reached.
+
+    Args:
+        fetch_page (Callable[[int], tuple[Sequence[T], bool] | None]): A function that fetches a page by its number
+            and returns its items and whether a next page exists, or None if the request failed.
+        page (int): The page number to start from.
+        prefetch (bool): Whether to fetch the next page in a background thread while the current one is consumed.
+            This hides the request latency of each page, at the cost of one extra request when stopping early.
+
+    Yields:
+        T: The items of each page, in order.
+
+    Raises:
+        NicoAPIError: If a page could not be fetched, after the items of the pages before it were yielded.
+    """
+    if not prefetch:
+        while True:
+            result = fetch_page(page)
+            if result is None:
+                raise NicoAPIError(message=f"Failed to fetch page {page}")
+            items, has_next = result
+            yield from items
+            if not has_next or not items:
+                return
+            page += 1
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future: Future[tuple[Sequence[T], bool] | None] | None = executor.submit(fetch_page, page)
+        while future is not None:
+            result = future.result()
+            if result is None:
+                raise NicoAPIError(message=f"Failed to fetch page {page}")
+            items, has_next = result
+            page += 1
+            future = executor.submit(fetch_page, page) if has_next and items else None
+            yield from items
+
+
+async def gather_pages(
+    fetch_page: Callable[[int], tuple[Sequence[T], int] | None],
+    *,
+    page_size: int,
+) -> list[T] | None:
+    """Fetch every page of a paginated endpoint concurrently.
+
+    The first page is fetched to learn the total count, then all remaining pages are fetched at once,
+    each in the event loop's default executor.
+
+    Args:
+        fetch_page (Callable[[int], tuple[Sequence[T], int] | None]): A function that fetches a page by its number
+            and returns its items and the total number of items, or None if the request failed.
+        page_size (int): The number of items per page that fetch_page requests.
+
+    Returns:
+        list[T] | None: The items of all pages in order, or None if any page could not be fetched.
+    """
+    loop = asyncio.get_running_loop()
+    first = await loop.run_in_executor(None, fetch_page, 1)
+    if first is None:
+        return None
+    items, total_count = first
+    last_page = -(-total_count // page_size)
+    rest = await asyncio.gather(*(loop.run_in_executor(None, fetch_page, page) for page in range(2, last_page + 1)))
+    all_items = list(items)
+    for result in rest:
+        if result is None:
+            return None
+        all_items.extend(result[0])
+    return all_items
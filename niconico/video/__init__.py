@@ -10,14 +10,20 @@ from niconico.base.client import BaseClient
 from niconico.decorators import login_required
 from niconico.objects.nvapi import (
     HistoryData,
+    HistoryResponse,
     LikeData,
     LikeHistoryData,
-    MylistData,
-    NvAPIResponse,
+    LikeHistoryResponse,
+    LikeResponse,
+    MylistResponse,
     SeriesData,
-    TagsData,
-    VideosData,
+    SeriesResponse,
+    TagsResponse,
+    VideosResponse,
+    extract_tag_names,
+    parse_nvapi,
 )
+from niconico.utils import build_query
 from niconico.video.ranking import VideoRankingClient
 from niconico.video.search import VideoSearchClient
 from niconico.video.watch import VideoWatchClient
@@ -52,33 +58,61 @@ class VideoClient(BaseClient):
         """
         res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/videos?watchIds={video_id}")
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[VideosData](**res.json())
+            res_cls = parse_nvapi(VideosResponse, res.content)
             if res_cls.data is not None and len(res_cls.data.items) >= 1:
                 return res_cls.data.items[0].video
         return None
 
-    def get_video_tags(self, video_id: str, edit_key: str) -> list[Tag] | None:
-        """Get the tags of a video by its ID.
+    def _get_video_tags_response(self, video_id: str, edit_key: str | None) -> requests.Response:
+        """Send a request for the tags of a video.
 
         Args:
             video_id (str): The ID of the video.
-            edit_key (str): The edit key for tag operations (required for v2 API).
-                            Can be obtained from WatchData.tag.edit.edit_key or WatchData.tag.viewer.edit_key.
+            edit_key (str | None): The edit key for tag operations, sent as X-Tag-Edit-Key if given.
 
         Returns:
-            list[Tag] | None: The tags of the video if found, None otherwise.
+            requests.Response: The response object.
         """
         headers = {}
         if edit_key is not None:
             headers["X-Tag-Edit-Key"] = edit_key
+        return self.niconico.get(f"https://nvapi.nicovideo.jp/v2/videos/{video_id}/tags", headers=headers)
 
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/videos/{video_id}/tags", headers=headers)
+    def get_video_tags(self, video_id: str, edit_key: str | None) -> list[Tag] | None:
+        """Get the tags of a video by its ID.
+
+        Args:
+            video_id (str): The ID of the video.
+            edit_key (str | None): The edit key for tag operations (required for v2 API).
+                            Can be obtained from WatchData.tag.edit.edit_key or WatchData.tag.viewer.edit_key.
+
+        Returns:
+            list[Tag] | None: The tags of the video if found, None otherwise.
+        """
+        res = self._get_video_tags_response(video_id, edit_key)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[TagsData](**res.json())
+            res_cls = parse_nvapi(TagsResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.tags
         return None
 
+    def get_video_tag_names(self, video_id: str, edit_key: str | None) -> list[str] | None:
+        """Get only the names of the tags of a video by its ID.
+
+        Unlike `get_video_tags`, this does not build a model for each tag.
+
+        Args:
+            video_id (str): The ID of the video.
+            edit_key (str | None): The edit key for tag operations (required for v2 API).
+
+        Returns:
+            list[str] | None: The tag names of the video if found, None otherwise.
+        """
+        res = self._get_video_tags_response(video_id, edit_key)
+        if res.status_code == requests.codes.ok:
+            return extract_tag_names(res.content)
+        return None
+
     def get_mylist(
         self,
         mylist_id: str,
@@ -100,15 +134,10 @@ class VideoClient(BaseClient):
         Returns:
             Mylist | None: The mylist object if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        if sort_key is not None:
-            query["sortKey"] = sort_key
-        if sort_order is not None:
-            query["sortOrder"] = sort_order
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/mylists/{mylist_id}?{query_str}")
+        query = build_query({"pageSize": page_size, "page": page, "sortKey": sort_key, "sortOrder": sort_order})
+        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/mylists/{mylist_id}", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[MylistData](**res.json())
+            res_cls = parse_nvapi(MylistResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.mylist
         return None
@@ -124,11 +153,10 @@ class VideoClient(BaseClient):
         Returns:
             SeriesData | None: The series object if found, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/series/{series_id}?{query_str}")
+        query = {"pageSize": page_size, "page": page}
+        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/series/{series_id}", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[SeriesData](**res.json())
+            res_cls = parse_nvapi(SeriesResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -144,11 +172,10 @@ class VideoClient(BaseClient):
         Returns:
             HistoryData | None: The history data if successful, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/watch/history?{query_str}")
+        query = {"pageSize": page_size, "page": page}
+        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/users/me/watch/history", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[HistoryData](**res.json())
+            res_cls = parse_nvapi(HistoryResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -165,7 +192,7 @@ class VideoClient(BaseClient):
         """
         res = self.niconico.post(f"https://nvapi.nicovideo.jp/v1/users/me/likes/items?videoId={video_id}")
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[LikeData](**res.json())
+            res_cls = parse_nvapi(LikeResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -181,11 +208,10 @@ class VideoClient(BaseClient):
         Returns:
             LikeHistoryData | None: The like history data if successful, None otherwise.
         """
-        query = {"pageSize": str(page_size), "page": str(page)}
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/users/me/likes?{query_str}")
+        query = {"pageSize": page_size, "page": page}
+        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/users/me/likes", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[LikeHistoryData](**res.json())
+            res_cls = parse_nvapi(LikeHistoryResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -7,7 +7,8 @@ from typing import TYPE_CHECKING, Literal
 import requests
 
 from niconico.base.client import BaseClient
-from niconico.objects.nvapi import GenresData, NvAPIResponse, PopularTagsData, RankingData
+from niconico.objects.nvapi import GenresResponse, PopularTagsResponse, RankingData, RankingResponse, parse_nvapi
+from niconico.utils import build_query
 
 if TYPE_CHECKING:
     from niconico.objects.video.ranking import Genre
@@ -24,7 +25,7 @@ class VideoRankingClient(BaseClient):
         """
         res = self.niconico.get("https://nvapi.nicovideo.jp/v2/genres")
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[GenresData](**res.json())
+            res_cls = parse_nvapi(GenresResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.genres
         return []
@@ -40,7 +41,7 @@ class VideoRankingClient(BaseClient):
         """
         res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/genres/{genre_key}/popular-tags")
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[PopularTagsData](**res.json())
+            res_cls = parse_nvapi(PopularTagsResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.tags
         return []
@@ -68,19 +69,18 @@ class VideoRankingClient(BaseClient):
         Returns:
             RankingData | None: The ranking data.
         """
-        query = {
-            "term": term,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if tag is not None:
-            query["tag"] = tag
-        if sensitive_contents is not None:
-            query["sensitiveContents"] = sensitive_contents
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/ranking/genre/{genre_key}?{query_str}")
+        query = build_query(
+            {
+                "term": term,
+                "pageSize": page_size,
+                "page": page,
+                "tag": tag,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
+        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/ranking/genre/{genre_key}", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RankingData](**res.json())
+            res_cls = parse_nvapi(RankingResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -104,17 +104,17 @@ class VideoRankingClient(BaseClient):
         Returns:
             list[str]: A list of hot topics.
         """
-        query = {
-            "term": term,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if sensitive_contents is not None:
-            query["sensitiveContents"] = sensitive_contents
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/ranking/hot-topic?{query_str}")
+        query = build_query(
+            {
+                "term": term,
+                "pageSize": page_size,
+                "page": page,
+                "sensitiveContents": sensitive_contents,
+            },
+        )
+        res = self.niconico.get("https://nvapi.nicovideo.jp/v1/ranking/hot-topic", params=query)
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[RankingData](**res.json())
+            res_cls = parse_nvapi(RankingResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data
         return None
@@ -2,16 +2,38 @@
 
 from __future__ import annotations
 
-import json
-from typing import TYPE_CHECKING, Any, Literal
+import asyncio
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 import requests
 
+try:
+    from orjson import OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+
+    def _dumps(obj: Any) -> str:  # noqa: ANN401
+        # Accept non-str keys the way the stdlib fallback does, so filters behave the same with or without orjson.
+        return _orjson_dumps(obj, option=OPT_NON_STR_KEYS).decode()
+
+except ImportError:
+    from json import dumps as _json_dumps
+
+    def _dumps(obj: Any) -> str:  # noqa: ANN401
+        return _json_dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
 from niconico.base.client import BaseClient
-from niconico.objects.nvapi import FacetData, ListSearchData, NvAPIResponse, VideoSearchData
+from niconico.objects.nvapi import FacetResponse, ListSearchResponse, VideoSearchResponse, parse_nvapi
 from niconico.objects.video.search import SnapshotSearchResponse
+from niconico.utils import TTLCache, build_query, iter_pages
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+
+    from niconico.niconico import NicoNico
+    from niconico.objects.nvapi import ListSearchData, NvAPIResponse, VideoSearchData
+    from niconico.objects.video import EssentialVideo
     from niconico.objects.video.search import (
         FacetItem,
         ListSearchSortKey,
@@ -19,14 +41,138 @@ if TYPE_CHECKING:
         SnapshotResponseField,
         SnapshotSortKey,
         SnapshotTargetField,
+        SnapshotVideoItem,
         VideoSearchSortKey,
         VideoSearchSortOrder,
     )
 
+T = TypeVar("T")
+
+_VIDEO_SEARCH_URL = "https://nvapi.nicovideo.jp/v2/search/video"
+_FACET_SEARCH_URL = "https://nvapi.nicovideo.jp/v2/search/facet"
+_LIST_SEARCH_URL = "https://nvapi.nicovideo.jp/v1/search/list"
+_SNAPSHOT_SEARCH_URL = "https://snapshot.search.nicovideo.jp/api/v2/snapshot/video/contents/search"
+
+_BOOL_STR = {True: "true", False: "false"}
+
+# The prefix of the snapshot "_sort" parameter for each sort order; only descending order is marked.
+_SORT_PREFIX = {"asc": "", "desc": "-", "none": ""}
+
+# The largest "_offset" the snapshot search API accepts.
+_SNAPSHOT_MAX_OFFSET = 100_000
+
+# The optional filters shared by the video and facet search endpoints: (argument name, query key, converter).
+_COMMON_PARAMS: tuple[tuple[str, str, Callable[[Any], str]], ...] = (
+    ("sensitive_content", "sensitiveContent", str),
+    ("channel_video_listing_status", "channelVideoListingStatus", str),
+    ("allow_future_contents", "allowFutureContents", _BOOL_STR.__getitem__),
+    ("search_by_user", "searchByUser", _BOOL_STR.__getitem__),
+    ("min_registered_at", "minRegisteredAt", str),
+    ("max_registered_at", "maxRegisteredAt", str),
+    ("max_duration", "maxDuration", str),
+)
+
+
+@lru_cache(maxsize=32)
+def _snapshot_headers(context: str) -> dict[str, str]:
+    """Get the headers of a snapshot search request for an application name.
+
+    The returned dict is shared between calls and must not be modified; NicoNico.get copies it.
+    """
+    return {"User-Agent": f"{context} (niconico.py)"}
+
 
 class VideoSearchClient(BaseClient):
     """A class that represents a video search client."""
 
+    search_cache: TTLCache
+
+    def __init__(self, niconico: NicoNico) -> None:
+        """Initialize the video search client."""
+        super().__init__(niconico)
+        self.search_cache = TTLCache(maxsize=256, ttl=60)
+
+    def clear_cache(self) -> None:
+        """Drop every cached response of the client, including search results."""
+        super().clear_cache()
+        self.clear_search_cache()
+
+    def clear_search_cache(self) -> None:
+        """Drop every cached search result."""
+        self.search_cache.clear()
+
+    def _search(self, url: str, response_cls: type[NvAPIResponse[T]], query: Mapping[str, str | int]) -> T | None:
+        """Send a search request, reusing the response body of an identical request made within the last minute.
+
+        Args:
+            url (str): The URL of the search endpoint.
+            response_cls (type[NvAPIResponse[T]]): The response model to parse the body into.
+            query (Mapping[str, str | int]): The query parameters of the search.
+
+        Returns:
+            T | None: The data of the response if the request succeeded, None otherwise.
+        """
+        # The raw body is cached and parsed again on a hit, so every caller gets its own mutable result.
+        key = (url, tuple(sorted(query.items())))
+        body = self.search_cache.get(key)
+        if body is not None:
+            return parse_nvapi(response_cls, body).data
+        res = self.niconico.get(url, params=query)
+        if res.status_code != requests.codes.ok:
+            return None
+        data = parse_nvapi(response_cls, res.content).data
+        if data is not None:
+            self.search_cache.set(key, res.content)
+        return data
+
+    def _common_params(self, **options: object) -> dict[str, str]:
+        """Build the query parameters of the optional filters shared by the video and facet search endpoints.
+
+        Args:
+            **options (object): The filters by argument name. Filters whose value is None are skipped.
+
+        Returns:
+            dict[str, str]: The query parameters of the filters that are set.
+        """
+        return {
+            key: convert(value) for name, key, convert in _COMMON_PARAMS if (value := options.get(name)) is not None
+        }
+
+    def _search_videos(
+        self,
+        param_name: Literal["keyword", "tag"],
+        param_value: str,
+        *,
+        sort_key: VideoSearchSortKey,
+        sort_order: VideoSearchSortOrder,
+        page_size: int,
+        page: int,
+        **options: object,
+    ) -> VideoSearchData | None:
+        """Search videos by a keyword or a tag.
+
+        Args:
+            param_name (Literal["keyword", "tag"]): The query key to search by.
+            param_value (str): The keyword or tag to search.
+            sort_key (VideoSearchSortKey): The sort key.
+            sort_order (VideoSearchSortOrder): The sort order.
+            page_size (int): The page size.
+            page (int): The page.
+            **options (object): The optional filters listed in _COMMON_PARAMS, by argument name.
+
+        Returns:
+            VideoSearchData | None: The search result.
+        """
+        query = {
+            param_name: param_value,
+            "sortKey": sort_key,
+            "sortOrder": sort_order,
+            "pageSize": str(page_size),
+            "page": str(page),
+            **self._common_params(**options),
+        }
+        return self._search(_VIDEO_SEARCH_URL, VideoSearchResponse, query)
+
     def search_videos_by_keyword(
         self,
         keyword: str,
@@ -62,34 +208,145 @@ class VideoSearchClient(BaseClient):
         Returns:
             VideoSearchData | None: The search result.
         """
-        query = {
-            "keyword": keyword,
-            "sortKey": sort_key,
-            "sortOrder": sort_order,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if sensitive_content is not None:
-            query["sensitiveContent"] = sensitive_content
-        if channel_video_listing_status is not None:
-            query["channelVideoListingStatus"] = channel_video_listing_status
-        if allow_future_contents is not None:
-            query["allowFutureContents"] = "true" if allow_future_contents else "false"
-        if search_by_user is not None:
-            query["searchByUser"] = "true" if search_by_user else "false"
-        if min_registered_at is not None:
-            query["minRegisteredAt"] = min_registered_at
-        if max_registered_at is not None:
-            query["maxRegisteredAt"] = max_registered_at
-        if max_duration is not None:
-            query["maxDuration"] = str(max_duration)
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/search/video?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[VideoSearchData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        return self._search_videos(
+            "keyword",
+            keyword,
+            sort_key=sort_key,
+            sort_order=sort_order,
+            page_size=page_size,
+            page=page,
+            sensitive_content=sensitive_content,
+            channel_video_listing_status=channel_video_listing_status,
+            allow_future_contents=allow_future_contents,
+            search_by_user=search_by_user,
+            min_registered_at=min_registered_at,
+            max_registered_at=max_registered_at,
+            max_duration=max_duration,
+        )
+
+    def iter_videos_by_keyword(
+        self,
+        keyword: str,
+        *,
+        sort_key: VideoSearchSortKey = "hot",
+        sort_order: VideoSearchSortOrder = "none",
+        page_size: int = 100,
+        sensitive_content: Literal["mask", "filter"] | None = None,
+        channel_video_listing_status: Literal["included"] | None = None,
+        allow_future_contents: bool | None = None,
+        search_by_user: bool | None = None,
+        min_registered_at: str | None = None,
+        max_registered_at: str | None = None,
+        max_duration: int | None = None,
+        prefetch: bool = False,
+    ) -> Iterator[EssentialVideo]:
+        """Iterate over videos searched by a keyword, fetching pages only as they are consumed.
+
+        Stopping early (e.g. with ``itertools.islice``) avoids requesting and parsing the remaining pages.
+
+        Args:
+            keyword (str): The keyword to search.
+            sort_key (VideoSearchSortKey): The sort key.
+            sort_order (VideoSearchSortOrder): The sort order.
+            page_size (int): The page size of each request.
+            sensitive_content (Literal["mask", "filter"] | None): The sensitive content.
+            channel_video_listing_status (Literal["included"] | None): The channel video listing status.
+            allow_future_contents (bool | None): The allow future contents.
+            search_by_user (bool | None): The search by user.
+            min_registered_at (str | None): The minimum registered at.
+            max_registered_at (str | None): The maximum registered at.
+            max_duration (int | None): The maximum duration.
+            prefetch (bool): Whether to fetch the next page in the background while the current one is consumed.
+
+        Yields:
+            EssentialVideo: The videos of the search result.
+
+        Raises:
+            NicoAPIError: If a page could not be fetched.
+        """
+
+        def fetch_page(page: int) -> tuple[list[EssentialVideo], bool] | None:
+            data = self.search_videos_by_keyword(
+                keyword,
+                sort_key=sort_key,
+                sort_order=sort_order,
+                page_size=page_size,
+                page=page,
+                sensitive_content=sensitive_content,
+                channel_video_listing_status=channel_video_listing_status,
+                allow_future_contents=allow_future_contents,
+                search_by_user=search_by_user,
+                min_registered_at=min_registered_at,
+                max_registered_at=max_registered_at,
+                max_duration=max_duration,
+            )
+            if data is None:
+                return None
+            return data.items, data.has_next
+
+        return iter_pages(fetch_page, prefetch=prefetch)
+
+    async def search_videos_by_keyword_pages_async(
+        self,
+        keyword: str,
+        *,
+        pages: Iterable[int] = range(1, 11),
+        sort_key: VideoSearchSortKey = "hot",
+        sort_order: VideoSearchSortOrder = "none",
+        page_size: int = 100,
+        sensitive_content: Literal["mask", "filter"] | None = None,
+        channel_video_listing_status: Literal["included"] | None = None,
+        allow_future_contents: bool | None = None,
+        search_by_user: bool | None = None,
+        min_registered_at: str | None = None,
+        max_registered_at: str | None = None,
+        max_duration: int | None = None,
+    ) -> list[EssentialVideo] | None:
+        """Search videos by a keyword, fetching several pages of the result concurrently.
+
+        Args:
+            keyword (str): The keyword to search.
+            pages (Iterable[int]): The page numbers to fetch.
+            sort_key (VideoSearchSortKey): The sort key.
+            sort_order (VideoSearchSortOrder): The sort order.
+            page_size (int): The page size of each request.
+            sensitive_content (Literal["mask", "filter"] | None): The sensitive content.
+            channel_video_listing_status (Literal["included"] | None): The channel video listing status.
+            allow_future_contents (bool | None): The allow future contents.
+            search_by_user (bool | None): The search by user.
+            min_registered_at (str | None): The minimum registered at.
+            max_registered_at (str | None): The maximum registered at.
+            max_duration (int | None): The maximum duration.
+
+        Returns:
+            list[EssentialVideo] | None: The videos of the fetched pages in page order, or None if any page could not
+                be fetched.
+        """
+
+        def fetch_page(page: int) -> VideoSearchData | None:
+            return self.search_videos_by_keyword(
+                keyword,
+                sort_key=sort_key,
+                sort_order=sort_order,
+                page_size=page_size,
+                page=page,
+                sensitive_content=sensitive_content,
+                channel_video_listing_status=channel_video_listing_status,
+                allow_future_contents=allow_future_contents,
+                search_by_user=search_by_user,
+                min_registered_at=min_registered_at,
+                max_registered_at=max_registered_at,
+                max_duration=max_duration,
+            )
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(loop.run_in_executor(None, fetch_page, page) for page in pages))
+        videos: list[EssentialVideo] = []
+        for data in results:
+            if data is None:
+                return None
+            videos.extend(data.items)
+        return videos
 
     def search_videos_by_tag(
         self,
@@ -126,34 +383,21 @@ class VideoSearchClient(BaseClient):
         Returns:
             VideoSearchData | None: The search result.
         """
-        query = {
-            "tag": tag,
-            "sortKey": sort_key,
-            "sortOrder": sort_order,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if sensitive_content is not None:
-            query["sensitiveContent"] = sensitive_content
-        if channel_video_listing_status is not None:
-            query["channelVideoListingStatus"] = channel_video_listing_status
-        if allow_future_contents is not None:
-            query["allowFutureContents"] = "true" if allow_future_contents else "false"
-        if search_by_user is not None:
-            query["searchByUser"] = "true" if search_by_user else "false"
-        if min_registered_at is not None:
-            query["minRegisteredAt"] = min_registered_at
-        if max_registered_at is not None:
-            query["maxRegisteredAt"] = max_registered_at
-        if max_duration is not None:
-            query["maxDuration"] = str(max_duration)
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/search/video?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[VideoSearchData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
+        return self._search_videos(
+            "tag",
+            tag,
+            sort_key=sort_key,
+            sort_order=sort_order,
+            page_size=page_size,
+            page=page,
+            sensitive_content=sensitive_content,
+            channel_video_listing_status=channel_video_listing_status,
+            allow_future_contents=allow_future_contents,
+            search_by_user=search_by_user,
+            min_registered_at=min_registered_at,
+            max_registered_at=max_registered_at,
+            max_duration=max_duration,
+        )
 
     def get_facet_by_keyword(
         self,
@@ -190,28 +434,18 @@ class VideoSearchClient(BaseClient):
             "keyword": keyword,
             "sortKey": sort_key,
             "sortOrder": sort_order,
+            **self._common_params(
+                sensitive_content=sensitive_content,
+                channel_video_listing_status=channel_video_listing_status,
+                allow_future_contents=allow_future_contents,
+                search_by_user=search_by_user,
+                min_registered_at=min_registered_at,
+                max_registered_at=max_registered_at,
+                max_duration=max_duration,
+            ),
         }
-        if sensitive_content is not None:
-            query["sensitiveContent"] = sensitive_content
-        if channel_video_listing_status is not None:
-            query["channelVideoListingStatus"] = channel_video_listing_status
-        if allow_future_contents is not None:
-            query["allowFutureContents"] = "true" if allow_future_contents else "false"
-        if search_by_user is not None:
-            query["searchByUser"] = "true" if search_by_user else "false"
-        if min_registered_at is not None:
-            query["minRegisteredAt"] = min_registered_at
-        if max_registered_at is not None:
-            query["maxRegisteredAt"] = max_registered_at
-        if max_duration is not None:
-            query["maxDuration"] = str(max_duration)
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/search/facet?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[FacetData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.items
-        return []
+        data = self._search(_FACET_SEARCH_URL, FacetResponse, query)
+        return data.items if data is not None else []
 
     def search_facet_by_tag(
         self,
@@ -248,28 +482,18 @@ class VideoSearchClient(BaseClient):
             "tag": tag,
             "sortKey": sort_key,
             "sortOrder": sort_order,
+            **self._common_params(
+                sensitive_content=sensitive_content,
+                channel_video_listing_status=channel_video_listing_status,
+                allow_future_contents=allow_future_contents,
+                search_by_user=search_by_user,
+                min_registered_at=min_registered_at,
+                max_registered_at=max_registered_at,
+                max_duration=max_duration,
+            ),
         }
-        if sensitive_content is not None:
-            query["sensitiveContent"] = sensitive_content
-        if channel_video_listing_status is not None:
-            query["channelVideoListingStatus"] = channel_video_listing_status
-        if allow_future_contents is not None:
-            query["allowFutureContents"] = "true" if allow_future_contents else "false"
-        if search_by_user is not None:
-            query["searchByUser"] = "true" if search_by_user else "false"
-        if min_registered_at is not None:
-            query["minRegisteredAt"] = min_registered_at
-        if max_registered_at is not None:
-            query["maxRegisteredAt"] = max_registered_at
-        if max_duration is not None:
-            query["maxDuration"] = str(max_duration)
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v2/search/facet?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[FacetData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data.items
-        return []
+        data = self._search(_FACET_SEARCH_URL, FacetResponse, query)
+        return data.items if data is not None else []
 
     def search_lists(
         self,
@@ -293,41 +517,103 @@ class VideoSearchClient(BaseClient):
         Returns:
             ListSearchData | None: The search result.
         """
-        query = {
-            "keyword": keyword,
-            "sortKey": sort_key,
-            "sortOrder": sort_order,
-            "pageSize": str(page_size),
-            "page": str(page),
-        }
-        if types is not None and len(types) == 1:
-            query["type"] = types[0]
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/search/list?{query_str}")
-        if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[ListSearchData](**res.json())
-            if res_cls.data is not None:
-                return res_cls.data
-        return None
-
-    def _build_filter_params(self, filters: dict[str, dict[str, Any] | list[Any]]) -> list[str]:
+        query = build_query(
+            {
+                "keyword": keyword,
+                "sortKey": sort_key,
+                "sortOrder": sort_order,
+                "pageSize": page_size,
+                "page": page,
+                "type": types[0] if types is not None and len(types) == 1 else None,
+            },
+        )
+        return self._search(_LIST_SEARCH_URL, ListSearchResponse, query)
+
+    def _build_filter_params(self, filters: dict[str, dict[str, Any] | list[Any]]) -> dict[str, str]:
         """Build filter parameters for snapshot search.
 
         Args:
             filters: Filter conditions dictionary.
 
         Returns:
-            List of filter parameter strings.
+            Dictionary of filter parameter names and values.
+        """
+        return {
+            f"filters[{field}][{key}]": str(value)
+            for field, conditions in filters.items()
+            for key, value in (conditions.items() if isinstance(conditions, dict) else enumerate(conditions))
+        }
+
+    def _build_snapshot_query(
+        self,
+        q: str,
+        targets: list[SnapshotTargetField],
+        _sort: SnapshotSortKey,
+        *,
+        fields: list[SnapshotResponseField] | None,
+        filters: dict[str, dict[str, Any] | list[Any]] | None,
+        json_filter: dict[str, Any] | None,
+        _sort_order: VideoSearchSortOrder,
+        _context: str,
+    ) -> dict[str, str]:
+        """Build the query of a snapshot search, except for the pagination parameters.
+
+        Args:
+            q (str): Search keyword.
+            targets (list[SnapshotTargetField]): Target fields for search.
+            _sort (SnapshotSortKey): Sort key.
+            fields (list[SnapshotResponseField] | None): Fields to include in response.
+            filters (dict | None): Filter conditions.
+            json_filter (dict | None): Complex filter conditions using JSON format.
+            _sort_order (VideoSearchSortOrder): Sort order.
+            _context (str): Service or application name.
+
+        Returns:
+            dict[str, str]: The query parameters.
+        """
+        query = {"q": q, "_context": _context}
+
+        query["targets"] = ",".join(targets)
+
+        if fields is not None:
+            query["fields"] = ",".join(fields)
+
+        # Combine sort key and order
+        query["_sort"] = _SORT_PREFIX[_sort_order] + _sort
+
+        # Handle filters parameter
+        if filters is not None:
+            query.update(self._build_filter_params(filters))
+
+        # Handle json_filter parameter
+        if json_filter is not None:
+            query["jsonFilter"] = _dumps(json_filter)
+
+        return query
+
+    def _search_snapshot(self, query: dict[str, str], *, use_cache: bool = True) -> SnapshotSearchResponse | None:
+        """Send a snapshot search request, reusing the body of an identical request made within the last minute.
+
+        Args:
+            query (dict[str, str]): The query parameters of the search.
+            use_cache (bool): Whether to look up and store the result in the search cache.
+
+        Returns:
+            SnapshotSearchResponse | None: The search result.
         """
-        filter_params = []
-        for field, conditions in filters.items():
-            if isinstance(conditions, dict):
-                for operator, value in conditions.items():
-                    filter_params.append(f"filters[{field}][{operator}]={value}")
-            elif isinstance(conditions, list):
-                for i, value in enumerate(conditions):
-                    filter_params.append(f"filters[{field}][{i}]={value}")
-        return filter_params
+        key = (_SNAPSHOT_SEARCH_URL, tuple(sorted(query.items())))
+        body = self.search_cache.get(key) if use_cache else None
+        if body is not None:
+            return SnapshotSearchResponse.model_validate_json(body)
+        # Make request with User-Agent header
+        headers = _snapshot_headers(query["_context"])
+        res = self.niconico.get(_SNAPSHOT_SEARCH_URL, params=query, headers=headers, timeout=30)
+        if res.status_code != requests.codes.ok:
+            return None
+        result = SnapshotSearchResponse.model_validate_json(res.content)
+        if use_cache:
+            self.search_cache.set(key, res.content)
+        return result
 
     def search_videos_snapshot(
         self,
@@ -363,40 +649,78 @@ class VideoSearchClient(BaseClient):
         Returns:
             SnapshotSearchResponse | None: The search result.
         """
-        query = {"q": q, "_offset": str(_offset), "_limit": str(_limit), "_context": _context}
-
-        query["targets"] = ",".join(targets)
-
-        if fields is not None:
-            query["fields"] = ",".join(fields)
+        query = {
+            **self._build_snapshot_query(
+                q,
+                targets,
+                _sort,
+                fields=fields,
+                filters=filters,
+                json_filter=json_filter,
+                _sort_order=_sort_order,
+                _context=_context,
+            ),
+            "_offset": str(_offset),
+            "_limit": str(_limit),
+        }
+        return self._search_snapshot(query)
 
-        # Combine sort key and order
-        sort_prefix = "" if _sort_order == "asc" else "-"
-        if _sort_order == "none":
-            query["_sort"] = _sort
-        else:
-            query["_sort"] = f"{sort_prefix}{_sort}"
+    def iter_videos_snapshot(
+        self,
+        q: str,
+        targets: list[SnapshotTargetField],
+        _sort: SnapshotSortKey,
+        *,
+        fields: list[SnapshotResponseField] | None = None,
+        filters: dict[str, dict[str, Any] | list[Any]] | None = None,
+        json_filter: dict[str, Any] | None = None,
+        _sort_order: VideoSearchSortOrder = "desc",
+        _limit: int = 100,
+        _context: str = "niconico.py",
+        prefetch: bool = False,
+    ) -> Iterator[SnapshotVideoItem]:
+        """Iterate over videos searched with Snapshot Search API v2, fetching pages only as they are consumed.
 
-        # Handle filters parameter
-        filter_params = []
-        if filters is not None:
-            filter_params = self._build_filter_params(filters)
+        Pages bypass the search cache, so only the current page of at most ``_limit`` items is held
+        (plus the next one with ``prefetch``), and large result sets can be scanned without materializing them.
+        Iteration stops at the API's maximum offset.
 
-        # Handle json_filter parameter
-        if json_filter is not None:
-            query["jsonFilter"] = json.dumps(json_filter, ensure_ascii=False)
+        Args:
+            q (str): Search keyword.
+            targets (list[SnapshotTargetField]): Target fields for search.
+            _sort (SnapshotSortKey): Sort key.
+            fields (list[SnapshotResponseField] | None): Fields to include in response.
+            filters (dict | None): Filter conditions.
+            json_filter (dict | None): Complex filter conditions using JSON format.
+            _sort_order (VideoSearchSortOrder): Sort order.
+            _limit (int): Number of results per request.
+            _context (str): Service or application name.
+            prefetch (bool): Whether to fetch the next page in the background while the current one is consumed.
 
-        # Build query string
-        query_str = "&".join([f"{key}={value}" for key, value in query.items()])
-        if filter_params:
-            query_str += "&" + "&".join(filter_params)
+        Yields:
+            SnapshotVideoItem: The videos of the search result.
 
-        # Make request with User-Agent header
-        headers = {"User-Agent": f"{_context} (niconico.py)"}
-        url = f"https://snapshot.search.nicovideo.jp/api/v2/snapshot/video/contents/search?{query_str}"
-
-        res = requests.get(url, headers=headers, timeout=30)
-        if res.status_code == requests.codes.ok:
-            response_data = res.json()
-            return SnapshotSearchResponse(**response_data)
-        return None
+        Raises:
+            NicoAPIError: If a page could not be fetched.
+        """
+        # Serialize the filters once for all pages; only the offset changes between requests.
+        base_query = self._build_snapshot_query(
+            q,
+            targets,
+            _sort,
+            fields=fields,
+            filters=filters,
+            json_filter=json_filter,
+            _sort_order=_sort_order,
+            _context=_context,
+        )
+
+        def fetch_page(page: int) -> tuple[list[SnapshotVideoItem], bool] | None:
+            offset = (page - 1) * _limit
+            res = self._search_snapshot({**base_query, "_offset": str(offset), "_limit": str(_limit)}, use_cache=False)
+            if res is None:
+                return None
+            next_offset = offset + len(res.data)
+            return res.data, next_offset < res.meta.total_count and next_offset <= _SNAPSHOT_MAX_OFFSET
+
+        return iter_pages(fetch_page, prefetch=prefetch)
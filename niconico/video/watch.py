@@ -16,7 +16,7 @@ import requests
 from niconico.base.client import BaseClient
 from niconico.decorators import login_required
 from niconico.exceptions import CommentAPIError, DownloadError, NicoAPIError, WatchAPIError
-from niconico.objects.nvapi import AccessRightsData, NvAPIResponse, ThreadKeyData
+from niconico.objects.nvapi import AccessRightsResponse, ThreadKeyResponse, parse_nvapi
 from niconico.objects.video.watch import (
     NvCommentAPIData,
     NvCommentAPIResponse,
@@ -101,7 +101,7 @@ class VideoWatchClient(BaseClient):
             headers={"X-Access-Right-Key": access_right_key},
         )
         if res.status_code == requests.codes.created:
-            res_cls = NvAPIResponse[AccessRightsData](**res.json())
+            res_cls = parse_nvapi(AccessRightsResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.content_url
         return None
@@ -126,7 +126,7 @@ class VideoWatchClient(BaseClient):
             headers={"X-Access-Right-Key": access_right_key},
         )
         if res.status_code == requests.codes.created:
-            res_cls = NvAPIResponse[AccessRightsData](**res.json())
+            res_cls = parse_nvapi(AccessRightsResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.content_url
         return None
@@ -320,7 +320,7 @@ class VideoWatchClient(BaseClient):
         """
         res = self.niconico.get(f"https://nvapi.nicovideo.jp/v1/comment/keys/thread?videoId={video_id}")
         if res.status_code == requests.codes.ok:
-            res_cls = NvAPIResponse[ThreadKeyData](**res.json())
+            res_cls = parse_nvapi(ThreadKeyResponse, res.content)
             if res_cls.data is not None:
                 return res_cls.data.thread_key
         return None
@@ -0,0 +1,93 @@
+"""Tests for niconico.utils."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from niconico.exceptions import NicoAPIError
+from niconico.utils import extract_video_id_from_url, extract_video_ids_from_urls, gather_pages, iter_pages
+
+
+class ExtractVideoIdTest(unittest.TestCase):
+    """Tests for extract_video_id_from_url and extract_video_ids_from_urls."""
+
+    def test_prefixed_ids(self) -> None:
+        """sm, nm and so IDs are found anywhere in the URL."""
+        assert extract_video_id_from_url("https://www.nicovideo.jp/watch/sm9") == "sm9"
+        assert extract_video_id_from_url("https://nico.ms/so123?from=1") == "so123"
+        assert extract_video_id_from_url("nm456") == "nm456"
+
+    def test_bare_digits_after_watch(self) -> None:
+        """A bare numeric ID is only taken right after /watch/."""
+        assert extract_video_id_from_url("https://www.nicovideo.jp/watch/1234567890") == "1234567890"
+
+    def test_query_digits_are_ignored(self) -> None:
+        """Digits in the query string are not mistaken for an ID."""
+        assert extract_video_id_from_url("https://www.nicovideo.jp/watch/sm9?t=12345") == "sm9"
+        assert extract_video_id_from_url("https://example.com/?t=12345") is None
+
+    def test_non_video_urls(self) -> None:
+        """Digits outside /watch/ are not video IDs."""
+        assert extract_video_id_from_url("https://www.nicovideo.jp/user/123") is None
+        assert extract_video_id_from_url("12345") is None
+
+    def test_many_urls(self) -> None:
+        """extract_video_ids_from_urls returns one entry per URL, None where no ID was found."""
+        urls = [
+            "https://www.nicovideo.jp/watch/sm9",
+            "https://www.nicovideo.jp/user/123",
+            "https://www.nicovideo.jp/watch/123?t=45",
+        ]
+        assert extract_video_ids_from_urls(urls) == ["sm9", None, "123"]
+        assert extract_video_ids_from_urls([]) == []
+
+
+class GatherPagesTest(unittest.TestCase):
+    """Tests for gather_pages."""
+
+    def test_returns_all_items_in_order(self) -> None:
+        """Every page is fetched and the items keep their page order."""
+
+        def fetch_page(page: int) -> tuple[list[int], int]:
+            return [page * 10, page * 10 + 1], 6
+
+        result = asyncio.run(gather_pages(fetch_page, page_size=2))
+        assert result == [10, 11, 20, 21, 30, 31]
+
+    def test_returns_none_when_first_page_fails(self) -> None:
+        """A failed first page yields None."""
+        result = asyncio.run(gather_pages(lambda _: None, page_size=2))
+        assert result is None
+
+    def test_returns_none_when_later_page_fails(self) -> None:
+        """A failed page after the first yields None instead of a list missing that page."""
+
+        def fetch_page(page: int) -> tuple[list[int], int] | None:
+            if page == 2:  # noqa: PLR2004
+                return None
+            return [page], 3
+
+        result = asyncio.run(gather_pages(fetch_page, page_size=1))
+        assert result is None
+
+
+class IterPagesTest(unittest.TestCase):
+    """Tests for iter_pages."""
+
+    def test_stops_after_last_page(self) -> None:
+        """Iteration ends quietly when the last page says there is no next one."""
+        result = list(iter_pages(lambda page: ([page], page < 3)))  # noqa: PLR2004
+        assert result == [1, 2, 3]
+
+    def test_raises_when_page_fails(self) -> None:
+        """A failed page raises after the items of the earlier pages were yielded, with and without prefetch."""
+        for prefetch in (False, True):
+            pages = iter_pages(lambda page: ([page], True) if page < 3 else None, prefetch=prefetch)  # noqa: PLR2004
+            assert [next(pages), next(pages)] == [1, 2]
+            with self.assertRaises(NicoAPIError):
+                next(pages)
+
+
+if __name__ == "__main__":
+    unittest.main()